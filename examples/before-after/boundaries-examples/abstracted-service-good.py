@@ -2,13 +2,29 @@
 # Benefits: Vendor independence, testable, maintainable, consistent
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Final
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from io import BytesIO
+from string import Template
+import asyncio
+import importlib
 import logging
+import os
+import time
+import uuid
+
+import pybase64
+import pybreaker
+from cachetools import TTLCache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 # Domain-focused interfaces (no vendor details)
 class DocumentStorage(ABC):
+    __slots__ = ()
+    
     @abstractmethod
     async def store_document(self, document: Document) -> StorageResult:
         pass
@@ -17,60 +33,91 @@ class DocumentStorage(ABC):
     async def get_document_url(self, document_id: str, expires_in_hours: int = 24) -> Optional[str]:
         pass
     
+    async def store_and_get_url(self, document: Document, 
+                                expires_in_hours: int = 24) -> Tuple[StorageResult, Optional[str]]:
+        """Store a document and return a shareable URL for it in one call."""
+        storage_result = await self.store_document(document)
+        if not storage_result.success:
+            return storage_result, None
+        return storage_result, await self.get_document_url(storage_result.document_id, expires_in_hours)
+    
     @abstractmethod
     async def cleanup_expired_documents(self, retention_days: int) -> int:
         pass
+    
+    async def warmup(self) -> None:
+        """Open connections ahead of real traffic; no-op unless an adapter needs it."""
 
 class EmailService(ABC):
+    __slots__ = ()
+    
     @abstractmethod
     async def send_email(self, email: Email) -> DeliveryResult:
         pass
+    
+    async def send_emails(self, emails: List[Email]) -> List[DeliveryResult]:
+        """Send many emails, returning one result per email in input order."""
+        return await asyncio.gather(*(self.send_email(email) for email in emails))
+    
+    async def warmup(self) -> None:
+        """Open connections ahead of real traffic; no-op unless an adapter needs it."""
 
 class SMSService(ABC):
+    __slots__ = ()
+    
     @abstractmethod
     async def send_sms(self, message: SMSMessage) -> DeliveryResult:
         pass
+    
+    async def warmup(self) -> None:
+        """Open connections ahead of real traffic; no-op unless an adapter needs it."""
 
 class DocumentGenerator(ABC):
+    __slots__ = ()
+    
     @abstractmethod
     async def generate_receipt(self, order_data: OrderData) -> Document:
         pass
 
+# Default senders - adapters use these when a message leaves its sender unset
+DEFAULT_FROM_ADDRESS: Final[str] = "orders@company.com"
+DEFAULT_FROM_PHONE: Final[str] = "+1234567890"
+
 # Domain models
-@dataclass
+@dataclass(slots=True)
 class Document:
-    content: bytes
+    content: BytesIO  # read-only after generation; getvalue() returns the original bytes
     filename: str
     content_type: str
     metadata: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class StorageResult:
     document_id: str
     success: bool
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Email:
     to_address: str
     subject: str
     html_content: str
-    from_address: str = "orders@company.com"
-    attachments: List[Document] = None
+    from_address: Optional[str] = None
+    attachments: List[Document] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class SMSMessage:
     to_phone: str
     content: str
-    from_phone: str = "+1234567890"
+    from_phone: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryResult:
     success: bool
     message_id: Optional[str] = None
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class OrderData:
     order_id: str
     total: float
@@ -79,141 +126,241 @@ class OrderData:
     customer_email: str
     customer_phone: str
 
+# Notification content templates - parsed once at import, filled per message
+ORDER_EMAIL_TEMPLATE = Template("""
+        <h1>Thank you for your order!</h1>
+        <p>Order ID: $order_id</p>
+        <p>Total: $$$total</p>
+        $receipt_link
+        """)
+
+ORDER_SMS_TEMPLATE = Template("Order Confirmed! Order #$order_id, Total: $$$total$receipt_text")
+
+SHIPPING_EMAIL_TEMPLATE = Template("""
+        <h1>Your order is on its way!</h1>
+        <p>Order ID: $order_id</p>
+        <p>Tracking Number: $tracking_number</p>
+        <p><a href="https://ups.com/track?tracknum=$tracking_number">Track Package</a></p>
+        """)
+
+SHIPPING_SMS_TEMPLATE = Template("Order $order_id shipped! Track: https://ups.com/track?tracknum=$tracking_number")
+
 # Clean business logic - no vendor knowledge
 class NotificationService:
     def __init__(self, 
                  document_storage: DocumentStorage,
                  email_service: EmailService,
                  sms_service: SMSService,
-                 document_generator: DocumentGenerator):
+                 document_generator: DocumentGenerator,
+                 max_concurrency: int = 50,
+                 dedup_window_seconds: int = 600):
         self.document_storage = document_storage
         self.email_service = email_service
         self.sms_service = sms_service
         self.document_generator = document_generator
+        # Caps in-flight confirmations so bulk sends stay within vendor rate limits
+        self.max_concurrency = max_concurrency
+        # Recently confirmed orders - retried or redelivered requests reuse the result
+        self._sent_confirmations = TTLCache(maxsize=100_000, ttl=dedup_window_seconds)
+        # Confirmations still running - concurrent requests for the same order await these
+        self._pending_confirmations: Dict[str, asyncio.Task] = {}
         self.logger = logging.getLogger(__name__)
 
     async def send_order_confirmation(self, order_data: OrderData) -> NotificationResult:
         """Send order confirmation via email and SMS with receipt."""
+        order_id = order_data.order_id
+        previous_result = self._sent_confirmations.get(order_id)
+        if previous_result:
+            return previous_result
+        
+        # Reserved before the first await, so duplicates arriving meanwhile join this send
+        task = self._pending_confirmations.get(order_id)
+        if task is None:
+            task = asyncio.create_task(self._confirm_order(order_data))
+            self._pending_confirmations[order_id] = task
+            task.add_done_callback(lambda _: self._pending_confirmations.pop(order_id, None))
+        # Shielded so one cancelled caller doesn't cancel the send for the others
+        return await asyncio.shield(task)
+
+    async def send_shipping_update(self, order_id: str, tracking_number: str, 
+                                 customer_email: str, customer_phone: str) -> NotificationResult:
+        """Send shipping notification via email and SMS."""
         try:
-            # Generate receipt document
-            receipt = await self.document_generator.generate_receipt(order_data)
-            
-            # Store receipt
-            storage_result = await self.document_storage.store_document(receipt)
-            if not storage_result.success:
-                self.logger.warning(f"Receipt storage failed: {storage_result.error_message}")
-            
-            # Get receipt URL for sharing
-            receipt_url = None
-            if storage_result.success:
-                receipt_url = await self.document_storage.get_document_url(
-                    storage_result.document_id, 
-                    expires_in_hours=24
-                )
-
-            # Send email notification
             email = Email(
-                to_address=order_data.customer_email,
-                subject=f"Order Confirmation - {order_data.order_id}",
-                html_content=self._create_order_email_content(order_data, receipt_url),
-                attachments=[receipt] if receipt else None
+                to_address=customer_email,
+                subject=f"Your order {order_id} has shipped!",
+                html_content=self._create_shipping_email_content(order_id, tracking_number)
             )
             
-            email_result = await self.email_service.send_email(email)
-            
-            # Send SMS notification
             sms = SMSMessage(
-                to_phone=order_data.customer_phone,
-                content=self._create_order_sms_content(order_data, receipt_url)
+                to_phone=customer_phone,
+                content=self._create_shipping_sms_content(order_id, tracking_number)
             )
             
-            sms_result = await self.sms_service.send_sms(sms)
+            email_result, sms_result = await self._deliver(email, sms)
             
-            # Return consolidated result
             return NotificationResult(
                 email_sent=email_result.success,
                 sms_sent=sms_result.success,
-                receipt_generated=storage_result.success,
-                receipt_url=receipt_url,
-                errors=self._collect_errors(email_result, sms_result, storage_result)
+                errors=self._collect_errors(email_result, sms_result)
             )
             
         except Exception as e:
-            self.logger.error(f"Order confirmation failed: {e}")
+            self.logger.error("Shipping notification failed: %s", e)
             return NotificationResult(
                 email_sent=False,
                 sms_sent=False,
-                receipt_generated=False,
                 errors=[f"Unexpected error: {str(e)}"]
             )
 
-    async def send_shipping_update(self, order_id: str, tracking_number: str, 
-                                 customer_email: str, customer_phone: str) -> NotificationResult:
-        """Send shipping notification via email and SMS."""
+    async def send_order_confirmations(self, orders: Iterable[OrderData]) -> List[NotificationResult]:
+        """Send confirmations for many orders concurrently, at most max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def send_one(order_data: OrderData) -> NotificationResult:
+            async with semaphore:
+                return await self.send_order_confirmation(order_data)
+        
+        return await asyncio.gather(*(send_one(order_data) for order_data in orders))
+
+    async def warmup(self) -> None:
+        """Establish vendor connections at startup so the first notifications don't pay for them."""
+        async def warm(service) -> None:
+            # Resolved inside the coroutine so a missing or failing hook lands in gather
+            hook = getattr(service, 'warmup', None)
+            if hook is not None:
+                await hook()
+        
+        results = await asyncio.gather(
+            warm(self.document_storage),
+            warm(self.email_service),
+            warm(self.sms_service),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning("Service warmup failed: %s", result)
+
+    async def aclose(self) -> None:
+        """Release vendor connections and render workers held by the injected services."""
+        async def close(service) -> None:
+            hook = getattr(service, 'close', None)
+            if hook is not None:
+                await hook()
+        
+        results = await asyncio.gather(
+            close(self.document_storage),
+            close(self.email_service),
+            close(self.sms_service),
+            close(self.document_generator),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning("Service shutdown failed: %s", result)
+
+    async def __aenter__(self) -> "NotificationService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def cleanup_old_receipts(self, retention_days: int = 90) -> int:
+        """Clean up old receipt documents."""
         try:
-            # Send email
+            return await self.document_storage.cleanup_expired_documents(retention_days)
+        except Exception as e:
+            self.logger.error("Receipt cleanup failed: %s", e)
+            return 0
+
+    async def _confirm_order(self, order_data: OrderData) -> NotificationResult:
+        """Generate, store and deliver one confirmation; caches it once fully successful."""
+        try:
+            # Generate receipt document
+            receipt = await self.document_generator.generate_receipt(order_data)
+            
+            # Store receipt and get its URL for sharing
+            storage_result, receipt_url = await self.document_storage.store_and_get_url(
+                receipt, 
+                expires_in_hours=24
+            )
+            if not storage_result.success:
+                self.logger.warning("Receipt storage failed: %s", storage_result.error_message)
+
+            # Build email and SMS notifications
             email = Email(
-                to_address=customer_email,
-                subject=f"Your order {order_id} has shipped!",
-                html_content=self._create_shipping_email_content(order_id, tracking_number)
+                to_address=order_data.customer_email,
+                subject=f"Order Confirmation - {order_data.order_id}",
+                html_content=self._create_order_email_content(order_data, receipt_url),
+                attachments=[receipt] if receipt else []
             )
             
-            email_result = await self.email_service.send_email(email)
-            
-            # Send SMS
             sms = SMSMessage(
-                to_phone=customer_phone,
-                content=self._create_shipping_sms_content(order_id, tracking_number)
+                to_phone=order_data.customer_phone,
+                content=self._create_order_sms_content(order_data, receipt_url)
             )
             
-            sms_result = await self.sms_service.send_sms(sms)
+            # Email and SMS are independent - send them concurrently
+            email_result, sms_result = await self._deliver(email, sms)
             
-            return NotificationResult(
+            # Return consolidated result
+            result = NotificationResult(
                 email_sent=email_result.success,
                 sms_sent=sms_result.success,
-                errors=self._collect_errors(email_result, sms_result)
+                receipt_generated=storage_result.success,
+                receipt_url=receipt_url,
+                errors=self._collect_errors(email_result, sms_result, storage_result)
             )
+            # Only fully successful confirmations are final; anything else may be retried
+            if not result.errors:
+                self._sent_confirmations[order_data.order_id] = result
+            return result
             
         except Exception as e:
-            self.logger.error(f"Shipping notification failed: {e}")
+            self.logger.error("Order confirmation failed: %s", e)
             return NotificationResult(
                 email_sent=False,
                 sms_sent=False,
+                receipt_generated=False,
                 errors=[f"Unexpected error: {str(e)}"]
             )
 
-    async def cleanup_old_receipts(self, retention_days: int = 90) -> int:
-        """Clean up old receipt documents."""
-        try:
-            return await self.document_storage.cleanup_expired_documents(retention_days)
-        except Exception as e:
-            self.logger.error(f"Receipt cleanup failed: {e}")
-            return 0
+    async def _deliver(self, email: Email, sms: SMSMessage) -> Tuple[DeliveryResult, DeliveryResult]:
+        """Send email and SMS concurrently; a failure in one never cancels the other."""
+        results = await asyncio.gather(
+            self.email_service.send_email(email),
+            self.sms_service.send_sms(sms),
+            return_exceptions=True
+        )
+        email_result, sms_result = (
+            DeliveryResult(success=False, error_message=str(result))
+            if isinstance(result, Exception) else result
+            for result in results
+        )
+        return email_result, sms_result
 
     # Private helper methods for content creation
     def _create_order_email_content(self, order_data: OrderData, receipt_url: Optional[str]) -> str:
         receipt_link = f'<p><a href="{receipt_url}">Download Receipt</a></p>' if receipt_url else ""
-        return f"""
-        <h1>Thank you for your order!</h1>
-        <p>Order ID: {order_data.order_id}</p>
-        <p>Total: ${order_data.total:.2f}</p>
-        {receipt_link}
-        """
+        return ORDER_EMAIL_TEMPLATE.substitute(
+            order_id=order_data.order_id,
+            total=f"{order_data.total:.2f}",
+            receipt_link=receipt_link
+        )
 
     def _create_order_sms_content(self, order_data: OrderData, receipt_url: Optional[str]) -> str:
         receipt_text = f"\nReceipt: {receipt_url}" if receipt_url else ""
-        return f"Order Confirmed! Order #{order_data.order_id}, Total: ${order_data.total:.2f}{receipt_text}"
+        return ORDER_SMS_TEMPLATE.substitute(
+            order_id=order_data.order_id,
+            total=f"{order_data.total:.2f}",
+            receipt_text=receipt_text
+        )
 
     def _create_shipping_email_content(self, order_id: str, tracking_number: str) -> str:
-        return f"""
-        <h1>Your order is on its way!</h1>
-        <p>Order ID: {order_id}</p>
-        <p>Tracking Number: {tracking_number}</p>
-        <p><a href="https://ups.com/track?tracknum={tracking_number}">Track Package</a></p>
-        """
+        return SHIPPING_EMAIL_TEMPLATE.substitute(order_id=order_id, tracking_number=tracking_number)
 
     def _create_shipping_sms_content(self, order_id: str, tracking_number: str) -> str:
-        return f"Order {order_id} shipped! Track: https://ups.com/track?tracknum={tracking_number}"
+        return SHIPPING_SMS_TEMPLATE.substitute(order_id=order_id, tracking_number=tracking_number)
 
     def _collect_errors(self, *results) -> List[str]:
         errors = []
@@ -223,85 +370,243 @@ class NotificationService:
         return errors
 
 # Result type for notifications
-@dataclass
+@dataclass(slots=True)
 class NotificationResult:
     email_sent: bool
     sms_sent: bool
     receipt_generated: bool = False
     receipt_url: Optional[str] = None
-    errors: List[str] = None
+    errors: List[str] = field(default_factory=list)
 
 # Adapter implementations handle vendor-specific details
+
+# S3 accepts at most 1000 keys per delete_objects request
+S3_DELETE_BATCH_SIZE = 1000
+# Concurrent delete_objects requests - kept low to stay clear of S3 throttling
+S3_DELETE_CONCURRENCY = 16
+def _uuid7() -> uuid.UUID:
+    """Time-ordered UUID version 7 (RFC 9562); uuid.uuid7 only exists on Python 3.14+."""
+    if hasattr(uuid, 'uuid7'):
+        return uuid.uuid7()
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (random_bits >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return uuid.UUID(int=value)
+
 class S3DocumentStorageAdapter(DocumentStorage):
+    __slots__ = ('bucket_name', 'aws_client', '_s3', '_s3_lock', 'logger')
+
     def __init__(self, bucket_name: str, aws_client):
         self.bucket_name = bucket_name
-        self.aws_client = aws_client
+        self.aws_client = aws_client  # aioboto3 client context, opened on first use
+        self._s3 = None
+        self._s3_lock = asyncio.Lock()
         self.logger = logging.getLogger(__name__)
 
     async def store_document(self, document: Document) -> StorageResult:
         try:
-            document_id = f"receipts/{document.metadata.get('order_id', 'unknown')}_{datetime.now().isoformat()}.pdf"
-            
-            self.aws_client.put_object(
-                Bucket=self.bucket_name,
-                Key=document_id,
-                Body=document.content,
-                ContentType=document.content_type,
-                ServerSideEncryption='AES256',
-                Metadata=document.metadata
-            )
-            
-            return StorageResult(document_id=document_id, success=True)
-            
+            s3 = await self._client()
+            return StorageResult(document_id=await self._upload(s3, document), success=True)
         except Exception as e:
-            self.logger.error(f"S3 storage failed: {e}")
+            self.logger.error("S3 storage failed: %s", e)
             return StorageResult(document_id="", success=False, error_message=str(e))
 
     async def get_document_url(self, document_id: str, expires_in_hours: int = 24) -> Optional[str]:
         try:
-            return self.aws_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': document_id},
-                ExpiresIn=expires_in_hours * 3600
-            )
+            return await self._presign(await self._client(), document_id, expires_in_hours)
         except Exception as e:
-            self.logger.error(f"URL generation failed: {e}")
+            self.logger.error("URL generation failed: %s", e)
             return None
 
+    async def store_and_get_url(self, document: Document, 
+                                expires_in_hours: int = 24) -> Tuple[StorageResult, Optional[str]]:
+        # Upload and presign on one client in a single coroutine - presigning
+        # is local signing work, not a second request
+        try:
+            s3 = await self._client()
+            document_id = await self._upload(s3, document)
+        except Exception as e:
+            self.logger.error("S3 storage failed: %s", e)
+            return StorageResult(document_id="", success=False, error_message=str(e)), None
+        
+        storage_result = StorageResult(document_id=document_id, success=True)
+        try:
+            return storage_result, await self._presign(s3, document_id, expires_in_hours)
+        except Exception as e:
+            self.logger.error("URL generation failed: %s", e)
+            return storage_result, None
+
     async def cleanup_expired_documents(self, retention_days: int) -> int:
         try:
             cutoff_date = datetime.now() - timedelta(days=retention_days)
-            response = self.aws_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix='receipts/'
-            )
+            semaphore = asyncio.Semaphore(S3_DELETE_CONCURRENCY)
             
-            deleted_count = 0
-            for obj in response.get('Contents', []):
-                if obj['LastModified'].replace(tzinfo=None) < cutoff_date:
-                    self.aws_client.delete_object(
-                        Bucket=self.bucket_name,
-                        Key=obj['Key']
-                    )
-                    deleted_count += 1
+            # Start deleting each full batch while later pages are still being listed;
+            # if listing fails, the TaskGroup cancels and awaits the deletes already started
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(self._delete_batch(batch, semaphore))
+                    async for batch in self._expired_key_batches(cutoff_date)
+                ]
             
-            return deleted_count
+            return sum(task.result() for task in tasks)
             
         except Exception as e:
-            self.logger.error(f"Cleanup failed: {e}")
+            # TaskGroup reports failures as an ExceptionGroup; log the underlying errors
+            errors = e.exceptions if isinstance(e, ExceptionGroup) else (e,)
+            self.logger.error("Cleanup failed: %s", "; ".join(map(str, errors)))
             return 0
 
+    async def warmup(self) -> None:
+        s3 = await self._client()
+        await s3.head_bucket(Bucket=self.bucket_name)
+
+    async def close(self) -> None:
+        """Release the pooled S3 connections."""
+        if self._s3 is not None:
+            await self.aws_client.__aexit__(None, None, None)
+            self._s3 = None
+
+    def _new_document_id(self, order_id: str) -> str:
+        # Shard on the UUID's random tail (its head is the timestamp) so writes
+        # spread across S3 key partitions instead of all hitting receipts/
+        doc_uuid = _uuid7()
+        return f"receipts/{doc_uuid.hex[-2:]}/{order_id}_{doc_uuid}.pdf"
+
+    async def _upload(self, s3, document: Document) -> str:
+        document_id = self._new_document_id(document.metadata.get('order_id', 'unknown'))
+        document.content.seek(0)
+        await s3.upload_fileobj(
+            document.content,
+            self.bucket_name,
+            document_id,
+            ExtraArgs={
+                'ContentType': document.content_type,
+                'ServerSideEncryption': 'AES256',
+                'Metadata': document.metadata
+            }
+        )
+        return document_id
+
+    async def _presign(self, s3, document_id: str, expires_in_hours: int) -> str:
+        return await s3.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': document_id},
+            ExpiresIn=expires_in_hours * 3600
+        )
+
+    async def _client(self):
+        # One shared client keeps a single connection pool for all calls
+        if self._s3 is None:
+            async with self._s3_lock:
+                if self._s3 is None:
+                    self._s3 = await self.aws_client.__aenter__()
+        return self._s3
+
+    async def _expired_key_batches(self, cutoff_date: datetime):
+        s3 = await self._client()
+        paginator = s3.get_paginator('list_objects_v2')
+        
+        batch = []
+        async for page in paginator.paginate(Bucket=self.bucket_name, Prefix='receipts/'):
+            for obj in page.get('Contents', []):
+                if obj['LastModified'].replace(tzinfo=None) < cutoff_date:
+                    batch.append({'Key': obj['Key']})
+                    if len(batch) == S3_DELETE_BATCH_SIZE:
+                        yield batch
+                        batch = []
+        
+        if batch:
+            yield batch
+
+    async def _delete_batch(self, keys: List[Dict[str, str]], semaphore: asyncio.Semaphore) -> int:
+        s3 = await self._client()
+        async with semaphore:
+            response = await s3.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={'Objects': keys, 'Quiet': True}
+            )
+        # Quiet mode only reports the keys that failed
+        return len(keys) - len(response.get('Errors', []))
+
+# Resilience policy for vendor calls: retry transient failures a few times,
+# and fail fast once a vendor keeps failing instead of waiting out timeouts
+def _vendor_status(error: Exception) -> Optional[int]:
+    # SendGrid errors carry status_code, Twilio errors carry status
+    return getattr(error, 'status_code', None) or getattr(error, 'status', None)
+
+def _is_transient_vendor_error(error: Exception) -> bool:
+    status = _vendor_status(error)
+    if status is None:
+        return isinstance(error, (ConnectionError, TimeoutError))
+    return status == 429 or status >= 500
+
+def _is_vendor_client_error(error: Exception) -> bool:
+    # Rejected requests say nothing about vendor health - don't trip the breaker
+    status = _vendor_status(error)
+    return status is not None and 400 <= status < 500 and status != 429
+
+def _vendor_circuit_breaker() -> pybreaker.CircuitBreaker:
+    return pybreaker.CircuitBreaker(fail_max=5, reset_timeout=30, exclude=[_is_vendor_client_error])
+
+# SendGrid accepts at most 1000 personalizations per mail/send request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+vendor_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.2, max=5),
+    retry=retry_if_exception(_is_transient_vendor_error),
+    reraise=True
+)
+
 class SendGridEmailAdapter(EmailService):
+    __slots__ = ('api_key', 'sendgrid_client', '_breaker', 'logger')
+
     def __init__(self, api_key: str, sendgrid_client):
         self.api_key = api_key
         self.sendgrid_client = sendgrid_client
+        self._breaker = _vendor_circuit_breaker()
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def breaker_state(self) -> str:
+        return self._breaker.current_state
+
     async def send_email(self, email: Email) -> DeliveryResult:
+        return await self._deliver([email])
+
+    async def send_emails(self, emails: List[Email]) -> List[DeliveryResult]:
+        # Identical emails to different recipients share one API request
+        groups = defaultdict(list)
+        for index, email in enumerate(emails):
+            groups[self._batch_key(email)].append(index)
+        
+        batches = [
+            indexes[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+            for indexes in groups.values()
+            for start in range(0, len(indexes), SENDGRID_MAX_PERSONALIZATIONS)
+        ]
+        batch_results = await asyncio.gather(
+            *(self._deliver([emails[index] for index in batch]) for batch in batches)
+        )
+        
+        results = [None] * len(emails)
+        for batch, result in zip(batches, batch_results):
+            for index in batch:
+                results[index] = result
+        return results
+
+    async def _deliver(self, emails: List[Email]) -> DeliveryResult:
         try:
-            # Transform domain object to SendGrid format
-            message = self._create_sendgrid_message(email)
-            response = self.sendgrid_client.send(message)
+            # Transform domain objects to SendGrid format
+            message = self._create_sendgrid_message(emails)
+            response = await self._send(message)
             
             return DeliveryResult(
                 success=200 <= response.status_code < 300,
@@ -309,28 +614,67 @@ class SendGridEmailAdapter(EmailService):
             )
             
         except Exception as e:
-            self.logger.error(f"SendGrid email failed: {e}")
+            self.logger.error("SendGrid email failed: %s", e)
             return DeliveryResult(success=False, error_message=str(e))
 
-    def _create_sendgrid_message(self, email: Email):
+    @vendor_retry
+    async def _send(self, message):
+        return await asyncio.to_thread(self._breaker.call, self.sendgrid_client.send, message)
+
+    def _batch_key(self, email: Email) -> tuple:
+        return (
+            email.subject,
+            email.html_content,
+            email.from_address,
+            tuple(id(document) for document in email.attachments)
+        )
+
+    def _create_sendgrid_message(self, emails: List[Email]) -> Dict[str, Any]:
         # SendGrid-specific message creation logic
         # This isolates vendor-specific code
-        pass
+        # The v3 mail/send payload is built as a plain dict, which the SDK
+        # sends as-is instead of walking its Mail helper objects
+        email = emails[0]
+        message = {
+            # One personalization per recipient so nobody sees the other addresses
+            'personalizations': [{'to': [{'email': recipient.to_address}]} for recipient in emails],
+            'from': {'email': email.from_address or DEFAULT_FROM_ADDRESS},
+            'subject': email.subject,
+            'content': [{'type': 'text/html', 'value': email.html_content}]
+        }
+        if email.attachments:
+            message['attachments'] = [self._create_attachment(document) for document in email.attachments]
+        return message
+
+    def _create_attachment(self, document: Document) -> Dict[str, str]:
+        # Encode the receipt already in memory - never re-download it from storage.
+        # getvalue() on an unmodified BytesIO returns the bytes it was built from,
+        # whereas getbuffer() would force it to copy them into a private buffer
+        encoded_content = pybase64.b64encode(document.content.getvalue()).decode('ascii')
+        return {
+            'content': encoded_content,
+            'type': document.content_type,
+            'filename': document.filename,
+            'disposition': 'attachment'
+        }
 
 class TwilioSMSAdapter(SMSService):
+    __slots__ = ('account_sid', 'auth_token', 'twilio_client', '_breaker', 'logger')
+
     def __init__(self, account_sid: str, auth_token: str, twilio_client):
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.twilio_client = twilio_client
+        self._breaker = _vendor_circuit_breaker()
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def breaker_state(self) -> str:
+        return self._breaker.current_state
+
     async def send_sms(self, message: SMSMessage) -> DeliveryResult:
         try:
-            response = self.twilio_client.messages.create(
-                body=message.content,
-                from_=message.from_phone,
-                to=message.to_phone
-            )
+            response = await self._create_message(message)
             
             return DeliveryResult(
                 success=True,
@@ -338,53 +682,120 @@ class TwilioSMSAdapter(SMSService):
             )
             
         except Exception as e:
-            self.logger.error(f"Twilio SMS failed: {e}")
+            self.logger.error("Twilio SMS failed: %s", e)
             return DeliveryResult(success=False, error_message=str(e))
 
+    async def warmup(self) -> None:
+        await asyncio.to_thread(self.twilio_client.api.accounts(self.account_sid).fetch)
+
+    @vendor_retry
+    async def _create_message(self, message: SMSMessage):
+        return await asyncio.to_thread(
+            self._breaker.call,
+            self.twilio_client.messages.create,
+            body=message.content,
+            from_=message.from_phone or DEFAULT_FROM_PHONE,
+            to=message.to_phone
+        )
+
+# Second-resolution ISO timestamp, re-formatted only when the second changes
+_iso_timestamp_cache = (0, "")
+
+def _iso_timestamp() -> str:
+    global _iso_timestamp_cache
+    second = time.time_ns() // 1_000_000_000
+    if _iso_timestamp_cache[0] != second:
+        _iso_timestamp_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _iso_timestamp_cache[1]
+
+def _render_receipt_pdf(pdf_library: str, order_data: OrderData) -> bytes:
+    # Vendor-specific PDF generation with the named library
+    # Module-level so it can be pickled into a worker process. Modules can't be
+    # pickled, so the worker imports the library itself (a dict lookup after the
+    # first call) and returns plain bytes, which cross back as a single buffer
+    pdf = importlib.import_module(pdf_library)
+    pass
+
 class PDFDocumentGenerator(DocumentGenerator):
-    def __init__(self, pdf_library):
+    __slots__ = ('pdf_library', '_executor', '_owns_executor')
+
+    def __init__(self, pdf_library: str, executor: Optional[Executor] = None):
+        # Module name, imported inside the render workers; only the name is sent per call
         self.pdf_library = pdf_library
+        # PDF rendering is CPU-bound, so it runs off the event loop; without an
+        # injected executor a process pool is started on first use and owned here
+        self._executor = executor
+        self._owns_executor = executor is None
 
     async def generate_receipt(self, order_data: OrderData) -> Document:
         # PDF generation logic isolated from business logic
-        content = self._generate_pdf_content(order_data)
+        loop = asyncio.get_running_loop()
+        pdf_bytes = await loop.run_in_executor(
+            self._render_pool(), _render_receipt_pdf, self.pdf_library, order_data
+        )
         
         return Document(
-            content=content,
+            # BytesIO shares the bytes object until something writes to it
+            content=BytesIO(pdf_bytes),
             filename=f"receipt_{order_data.order_id}.pdf",
             content_type="application/pdf",
             metadata={
                 "order_id": order_data.order_id,
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": _iso_timestamp(),
                 "customer_email": order_data.customer_email
             }
         )
 
-    def _generate_pdf_content(self, order_data: OrderData) -> bytes:
-        # Vendor-specific PDF generation
-        pass
+    async def close(self) -> None:
+        """Shut down the render pool if this generator started it."""
+        if self._owns_executor and self._executor is not None:
+            executor, self._executor = self._executor, None
+            # Waiting for the workers to exit blocks, so it happens off the event loop
+            await asyncio.to_thread(executor.shutdown)
+
+    def _render_pool(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._executor
 
 # Dependency injection setup
+
+# Connection pool sizes - bursts above these wait for a free connection
+S3_MAX_POOL_CONNECTIONS = 50
+TWILIO_MAX_POOL_CONNECTIONS = 50
+
 def create_notification_service():
     # Configuration and dependency injection
     # All vendor-specific setup happens here
+    import aioboto3
+    from botocore.config import Config
+    from requests.adapters import HTTPAdapter
+    from sendgrid import SendGridAPIClient
+    from twilio.http.http_client import TwilioHttpClient
+    from twilio.rest import Client as TwilioClient
     
-    # AWS setup
-    aws_client = None  # boto3.client('s3', ...)
+    # AWS setup - one keep-alive pool shared by uploads, presigning and cleanup
+    aws_client = aioboto3.Session().client('s3', config=Config(
+        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        retries={'mode': 'adaptive'}
+    ))
     document_storage = S3DocumentStorageAdapter("receipts-bucket", aws_client)
     
-    # SendGrid setup
-    sendgrid_client = None  # SendGridAPIClient(...)
+    # SendGrid setup - its HTTP client has no pluggable transport to pool
+    sendgrid_client = SendGridAPIClient("api-key")
     email_service = SendGridEmailAdapter("api-key", sendgrid_client)
     
-    # Twilio setup
-    twilio_client = None  # TwilioClient(...)
+    # Twilio setup - reuse TLS connections through a sized requests pool
+    twilio_http = TwilioHttpClient(pool_connections=True, timeout=10)
+    twilio_http.session.mount('https://', HTTPAdapter(pool_maxsize=TWILIO_MAX_POOL_CONNECTIONS))
+    twilio_client = TwilioClient("sid", "token", http_client=twilio_http)
     sms_service = TwilioSMSAdapter("sid", "token", twilio_client)
     
-    # PDF generation setup
-    pdf_library = None  # reportlab or similar
-    document_generator = PDFDocumentGenerator(pdf_library)
+    # PDF generation setup - the library is named, and imported inside the render workers
+    document_generator = PDFDocumentGenerator("reportlab.pdfgen")
     
+    # Callers own the returned service: `async with` (or aclose()) releases the
+    # S3 connections and the render processes
     return NotificationService(
         document_storage=document_storage,
         email_service=email_service,
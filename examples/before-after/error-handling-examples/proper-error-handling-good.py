@@ -3,16 +3,21 @@
 # Graceful error recovery
 # Rich error context for debugging
 
-import json
+import asyncio
 import logging
-import requests
+import random
+import re
+import sys
+import httpx
+import orjson
+import uvloop
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple, TypeVar
+from dataclasses import dataclass, field
 from enum import Enum
-import traceback
 import time
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
+from collections import Counter
 
 # Configure structured logging
 logging.basicConfig(
@@ -26,7 +31,10 @@ class ErrorSeverity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-@dataclass
+# Resolved once so error logging doesn't go through Enum.value on every call
+_SEV_STR = {severity: sys.intern(severity.value) for severity in ErrorSeverity}
+
+@dataclass(slots=True)
 class ProcessingError:
     """Rich error context for debugging and monitoring"""
     error_type: str
@@ -36,10 +44,10 @@ class ProcessingError:
     severity: ErrorSeverity = ErrorSeverity.MEDIUM
     recoverable: bool = True
     retry_after: Optional[int] = None
-    context: Optional[Dict] = None
+    context: Dict = field(default_factory=dict)
     original_exception: Optional[Exception] = None
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Rich result object with success/failure details"""
     success: bool
@@ -47,22 +55,32 @@ class ProcessingResult:
     failed_count: int
     errors: List[ProcessingError]
     processing_time: float
-    context: Optional[Dict] = None
+    context: Dict = field(default_factory=dict)
 
 class DataProcessingException(Exception):
     """Base exception for data processing errors"""
     def __init__(self, message: str, error_type: str, severity: ErrorSeverity = ErrorSeverity.MEDIUM, 
-                 recoverable: bool = True, context: Dict = None, original_exception: Exception = None):
+                 recoverable: bool = True, context: Dict = None, original_exception: Exception = None,
+                 retry_after: Optional[float] = None):
         super().__init__(message)
-        self.error_type = error_type
+        self.message = message
+        # Interned so metric/log keys built from it compare by identity
+        self.error_type = sys.intern(error_type)
         self.severity = severity
         self.recoverable = recoverable
         self.context = context or {}
         self.original_exception = original_exception
+        self.retry_after = retry_after  # Server-requested delay before retrying, if any
 
 class ValidationError(DataProcessingException):
     """Specific exception for data validation errors"""
-    def __init__(self, message: str, field: str, value: any, context: Dict = None):
+    def __init__(self, message: Optional[str], field: str, value: any, context: Dict = None):
+        if message is None:
+            # Multi-field failures pass message=None and their (field, reason) pairs in context
+            errors = (context or {}).get("validation_errors", ())
+            message = "User data validation failed: " + "; ".join(
+                f"{name}: {reason}" for name, reason in errors
+            )
         super().__init__(
             message, 
             "VALIDATION_ERROR", 
@@ -73,13 +91,15 @@ class ValidationError(DataProcessingException):
 
 class NetworkError(DataProcessingException):
     """Specific exception for network-related errors"""
-    def __init__(self, message: str, url: str, status_code: int = None, context: Dict = None):
+    def __init__(self, message: str, url: str, status_code: int = None, context: Dict = None,
+                 retry_after: Optional[float] = None):
         super().__init__(
             message,
             "NETWORK_ERROR",
             ErrorSeverity.HIGH,
             recoverable=True,
-            context={"url": url, "status_code": status_code, **(context or {})}
+            context={"url": url, "status_code": status_code, **(context or {})},
+            retry_after=retry_after
         )
 
 class DatabaseError(DataProcessingException):
@@ -93,6 +113,17 @@ class DatabaseError(DataProcessingException):
             context={"operation": operation, **(context or {})}
         )
 
+class CircuitOpenError(DataProcessingException):
+    """Raised without calling downstream while the circuit breaker is OPEN"""
+    def __init__(self, message: str = "Circuit breaker is OPEN", context: Dict = None):
+        super().__init__(
+            message,
+            "CIRCUIT_BREAKER_OPEN",
+            ErrorSeverity.HIGH,
+            recoverable=True,
+            context=context
+        )
+
 class StructuredLogger:
     """Structured logging for better observability"""
     
@@ -101,34 +132,57 @@ class StructuredLogger:
     
     def log_error(self, error: ProcessingError, request_id: str = None):
         """Log error with structured context"""
+        # Skip building context and stack traces for records that would be dropped
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         log_context = {
             "error_type": error.error_type,
-            "severity": error.severity.value,
+            "severity": _SEV_STR[error.severity],
             "recoverable": error.recoverable,
-            "user_id": error.user_id,
-            "operation": error.operation,
-            "request_id": request_id,
-            "context": error.context
         }
+        # Only attach the optional fields that are actually set
+        if error.user_id is not None:
+            log_context["user_id"] = error.user_id
+        if error.operation is not None:
+            log_context["operation"] = error.operation
+        if request_id is not None:
+            log_context["request_id"] = request_id
+        if error.context:
+            log_context["context"] = error.context
         
+        exc_info = None
         if error.original_exception:
-            log_context["exception_type"] = type(error.original_exception).__name__
-            log_context["stack_trace"] = traceback.format_exception(
-                type(error.original_exception), 
-                error.original_exception, 
-                error.original_exception.__traceback__
-            )
+            exc = error.original_exception
+            log_context["exception_type"] = type(exc).__name__
+            # The formatter renders the traceback only if a handler actually emits the record
+            exc_info = (type(exc), exc, exc.__traceback__)
         
-        self.logger.error(f"Processing error: {error.message}", extra=log_context)
+        self.logger.error("Processing error: %s", error.message, exc_info=exc_info, extra=log_context)
     
-    def log_success(self, operation: str, context: Dict, request_id: str = None):
+    def log_success(self, operation: str, context: Dict, request_id: str = None,
+                    level: int = logging.INFO):
         """Log successful operations"""
-        log_context = {
-            "operation": operation,
-            "request_id": request_id,
-            **context
-        }
-        self.logger.info(f"Operation completed successfully: {operation}", extra=log_context)
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        if not context and request_id is None:
+            self.logger.log(level, "Operation completed successfully: %s", operation)
+            return
+        
+        log_context = {"operation": operation, **context}
+        if request_id is not None:
+            log_context["request_id"] = request_id
+        self.logger.log(level, "Operation completed successfully: %s", operation, extra=log_context)
+
+_STRUCTURED_LOGGERS: Dict[str, StructuredLogger] = {}
+
+def get_structured_logger(name: str) -> StructuredLogger:
+    """Return the shared StructuredLogger for a component, creating it on first use"""
+    logger = _STRUCTURED_LOGGERS.get(name)
+    if logger is None:
+        logger = _STRUCTURED_LOGGERS[name] = StructuredLogger(name)
+    return logger
 
 class CircuitBreaker:
     """Circuit breaker pattern to prevent cascading failures"""
@@ -139,50 +193,143 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self._lock = asyncio.Lock()
+        self._half_open_inflight = 0
     
-    @contextmanager
-    def call(self):
+    @asynccontextmanager
+    async def call(self):
         """Context manager for circuit breaker calls"""
-        if self.state == "OPEN":
-            if time.time() - self.last_failure_time < self.recovery_timeout:
-                raise DataProcessingException(
-                    "Circuit breaker is OPEN", 
-                    "CIRCUIT_BREAKER_OPEN",
-                    ErrorSeverity.HIGH,
-                    recoverable=True
-                )
-            else:
+        async with self._lock:
+            if self.state == "OPEN":
+                # Fail fast; monotonic time keeps wall-clock jumps out of the recovery window
+                if time.monotonic() - self.last_failure_time < self.recovery_timeout:
+                    raise CircuitOpenError()
                 self.state = "HALF_OPEN"
+            
+            # Only one probe goes through while HALF_OPEN, everyone else fails fast
+            is_probe = self.state == "HALF_OPEN"
+            if is_probe:
+                if self._half_open_inflight:
+                    raise CircuitOpenError()
+                self._half_open_inflight = 1
         
+        # Calls admitted while CLOSED can finish after the breaker trips; only the probe,
+        # or a call finishing while the breaker is still CLOSED, may change its state
         try:
             yield
+        except Exception:
+            async with self._lock:
+                if is_probe or self.state == "CLOSED":
+                    self.failure_count += 1
+                    self.last_failure_time = time.monotonic()
+                    if is_probe or self.failure_count >= self.failure_threshold:
+                        self.state = "OPEN"
+            raise
+        else:
             # Success - reset circuit breaker
-            self.failure_count = 0
-            self.state = "CLOSED"
+            async with self._lock:
+                if is_probe or self.state == "CLOSED":
+                    self.failure_count = 0
+                    self.state = "CLOSED"
+        finally:
+            if is_probe:
+                self._half_open_inflight = 0
+
+T = TypeVar("T")
+
+# Retry settings
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 5.0
+
+def _is_recoverable(exc: Exception) -> bool:
+    """Default retry classifier: only recoverable processing errors are retried"""
+    # An open circuit is recoverable later, but retrying it now just burns the backoff budget
+    if isinstance(exc, CircuitOpenError):
+        return False
+    return isinstance(exc, DataProcessingException) and exc.recoverable
+
+def _backoff_delays(base: float, cap: float):
+    """Decorrelated jitter: each delay is drawn from [base, 3 * previous delay], capped"""
+    delay = base
+    while True:
+        delay = min(cap, random.uniform(base, delay * 3))
+        yield delay
+
+def _next_delay(exc: Exception, delays, cap: float) -> float:
+    """Honor a server-requested retry_after (up to cap), otherwise take the next jittered delay"""
+    retry_after = getattr(exc, "retry_after", None)
+    return min(retry_after, cap) if retry_after is not None else next(delays)
+
+async def _retry(fn: Callable[[], Awaitable[T]], *, max_attempts: int = 3,
+                 base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY,
+                 retry_if: Callable[[Exception], bool] = _is_recoverable,
+                 on_retry: Callable[[Exception, int, float], None] = None) -> T:
+    """Await fn(), retrying failures that retry_if accepts with jittered backoff"""
+    delays = _backoff_delays(base, cap)
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await fn()
         except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.failure_count >= self.failure_threshold:
-                self.state = "OPEN"
-            
-            raise
+            if attempt == max_attempts or not retry_if(e):
+                raise
+            delay = _next_delay(e, delays, cap)
+            if on_retry:
+                on_retry(e, attempt, delay)
+            await asyncio.sleep(delay)
+
+def _retry_sync(fn: Callable[[], T], *, max_attempts: int = 3,
+                base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY,
+                retry_if: Callable[[Exception], bool] = _is_recoverable) -> T:
+    """Blocking counterpart of _retry for synchronous callers"""
+    delays = _backoff_delays(base, cap)
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_attempts or not retry_if(e):
+                raise
+            time.sleep(_next_delay(e, delays, cap))
+
+# HTTP client settings
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 10
+POOL_MAX_SIZE = 64
 
 class DataProcessor:
     """Robust data processor with comprehensive error handling"""
     
-    def __init__(self):
-        self.api_url = "https://api.example.com"
+    _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+    
+    def __init__(self, max_concurrency: int = 10, api_url: str = "https://api.example.com"):
+        self.api_url = api_url
+        self._user_url = api_url + "/users/{}"
+        self._request_id: Optional[str] = None
+        self._request_headers: Optional[Dict[str, str]] = None
+        # Error responses are dispatched on their status class instead of a comparison ladder
+        self._status_handlers = {4: self._on_4xx, 5: self._on_5xx}
+        self.max_concurrency = max_concurrency
+        self.client: Optional[httpx.AsyncClient] = None
         self.database = DatabaseConnection()
         self.cache = CacheService()
-        self.logger = StructuredLogger("data_processor")
+        self.logger = get_structured_logger("data_processor")
         self.circuit_breaker = CircuitBreaker()
         self.metrics = MetricsCollector()
     
-    def process_user_data(self, user_ids: List[str], request_id: str = None) -> ProcessingResult:
-        """Process user data with robust error handling"""
-        start_time = time.time()
-        processed_count = 0
+    async def __aenter__(self) -> "DataProcessor":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP connection pool"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def process_user_data(self, user_ids: List[str], request_id: str = None) -> ProcessingResult:
+        """Process user data concurrently with robust error handling"""
+        start_time = time.monotonic()
         errors = []
         results = {}
         
@@ -191,44 +338,23 @@ class DataProcessor:
             "request_id": request_id
         })
         
-        for user_id in user_ids:
-            try:
-                user_data = self.fetch_user_data_with_retry(user_id, request_id)
-                if user_data:
-                    results[user_id] = user_data
-                    processed_count += 1
-                    
-            except DataProcessingException as e:
-                error = ProcessingError(
-                    error_type=e.error_type,
-                    message=e.message,
-                    user_id=user_id,
-                    operation="fetch_user_data",
-                    severity=e.severity,
-                    recoverable=e.recoverable,
-                    context=e.context,
-                    original_exception=e.original_exception
-                )
-                errors.append(error)
-                self.logger.log_error(error, request_id)
-                self.metrics.record_error(e.error_type, e.severity)
-                
-            except Exception as e:
-                # Unexpected error - wrap with context
-                error = ProcessingError(
-                    error_type="UNEXPECTED_ERROR",
-                    message=f"Unexpected error processing user {user_id}: {str(e)}",
-                    user_id=user_id,
-                    operation="fetch_user_data",
-                    severity=ErrorSeverity.HIGH,
-                    recoverable=True,
-                    original_exception=e
-                )
-                errors.append(error)
-                self.logger.log_error(error, request_id)
-                self.metrics.record_error("UNEXPECTED_ERROR", ErrorSeverity.HIGH)
+        # Bounded queue applies backpressure: user IDs are fed only as fast as
+        # the fixed pool of workers can fetch them
+        queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        async with asyncio.TaskGroup() as task_group:
+            workers = [
+                task_group.create_task(self._process_queue(queue, results, errors, request_id))
+                for _ in range(self.max_concurrency)
+            ]
+            
+            for user_id in user_ids:
+                await queue.put(user_id)
+            for _ in range(self.max_concurrency):
+                await queue.put(None)  # One stop signal per worker
         
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
+        # Counted per fetch rather than len(results): duplicate user IDs share one results entry
+        processed_count = sum(worker.result() for worker in workers)
         
         result = ProcessingResult(
             success=len(errors) == 0,
@@ -242,131 +368,203 @@ class DataProcessor:
         self.metrics.record_processing_result(result)
         return result
     
-    def fetch_user_data_with_retry(self, user_id: str, request_id: str = None, max_retries: int = 3) -> Optional[Dict]:
-        """Fetch user data with retry logic"""
-        for attempt in range(max_retries + 1):
+    async def _process_queue(self, queue: asyncio.Queue, results: Dict, 
+                             errors: List[ProcessingError], request_id: str) -> int:
+        """Worker: fetch queued users until the stop signal arrives; returns how many succeeded"""
+        processed_count = 0
+        while (user_id := await queue.get()) is not None:
             try:
-                with self.circuit_breaker.call():
-                    return self.fetch_user_data(user_id, request_id)
+                user_data = await self.fetch_user_data_with_retry(user_id, request_id)
+                if user_data:
+                    results[user_id] = user_data
+                    processed_count += 1
                     
-            except NetworkError as e:
-                if attempt == max_retries:
-                    raise  # Final attempt failed
-                
-                # Exponential backoff
-                wait_time = 2 ** attempt
+            except Exception as e:
+                error = self._to_processing_error(e, user_id)
+                errors.append(error)
+                self.logger.log_error(error, request_id)
+                self.metrics.record_error(error.error_type, error.severity)
+        return processed_count
+    
+    def _to_processing_error(self, exc: Exception, user_id: str) -> ProcessingError:
+        """Classify a failed fetch into a ProcessingError"""
+        if isinstance(exc, DataProcessingException):
+            return ProcessingError(
+                error_type=exc.error_type,
+                message=exc.message,
+                user_id=user_id,
+                operation="fetch_user_data",
+                severity=exc.severity,
+                recoverable=exc.recoverable,
+                context=exc.context,
+                retry_after=exc.retry_after,
+                original_exception=exc.original_exception
+            )
+        
+        # Unexpected error - wrap with context
+        return ProcessingError(
+            error_type="UNEXPECTED_ERROR",
+            message=f"Unexpected error processing user {user_id}: {str(exc)}",
+            user_id=user_id,
+            operation="fetch_user_data",
+            severity=ErrorSeverity.HIGH,
+            recoverable=True,
+            original_exception=exc
+        )
+    
+    async def fetch_user_data_with_retry(self, user_id: str, request_id: str = None, max_retries: int = 3) -> Optional[Dict]:
+        """Fetch user data with retry logic"""
+        async def attempt() -> Dict:
+            async with self.circuit_breaker.call():
+                return await self.fetch_user_data(user_id, request_id)
+        
+        def log_retry(e: Exception, attempt_number: int, delay: float) -> None:
+            if isinstance(e, NetworkError):
                 self.logger.logger.warning(
-                    f"Network error fetching user {user_id}, retrying in {wait_time}s: {e.message}",
-                    extra={"attempt": attempt + 1, "max_retries": max_retries, "user_id": user_id}
+                    "Network error fetching user %s, retrying in %.1fs: %s", user_id, delay, e.message,
+                    extra={"attempt": attempt_number, "max_retries": max_retries, "user_id": user_id}
                 )
-                time.sleep(wait_time)
-                
-            except DataProcessingException as e:
-                if not e.recoverable:
-                    raise  # Don't retry non-recoverable errors
-                
-                if attempt == max_retries:
-                    raise
-                
-                wait_time = 2 ** attempt
-                time.sleep(wait_time)
-    
-    def fetch_user_data(self, user_id: str, request_id: str = None) -> Dict:
+        
+        return await _retry(attempt, max_attempts=max_retries + 1, on_retry=log_retry)
+    
+    async def fetch_user_data(self, user_id: str, request_id: str = None) -> Dict:
         """Fetch user data with proper error handling"""
         if not user_id or not user_id.strip():
             raise ValidationError("User ID cannot be empty", "user_id", user_id)
         
+        url = self._user_url.format(user_id)
         try:
-            response = requests.get(
-                f"{self.api_url}/users/{user_id}",
-                timeout=10,
-                headers={"X-Request-ID": request_id} if request_id else {}
-            )
-            
-            if response.status_code == 404:
-                raise DataProcessingException(
-                    f"User {user_id} not found",
-                    "USER_NOT_FOUND",
-                    ErrorSeverity.LOW,
-                    recoverable=False,
-                    context={"user_id": user_id, "status_code": 404}
-                )
+            response = await self._get_client().get(url, headers=self._headers_for(request_id))
+            status_code = response.status_code
+            body = response.content
             
-            if response.status_code >= 500:
-                raise NetworkError(
-                    f"Server error fetching user {user_id}",
-                    f"{self.api_url}/users/{user_id}",
-                    response.status_code,
-                    {"user_id": user_id}
-                )
-            
-            if response.status_code >= 400:
-                raise NetworkError(
-                    f"Client error fetching user {user_id}: {response.text}",
-                    f"{self.api_url}/users/{user_id}",
-                    response.status_code,
-                    {"user_id": user_id}
-                )
-            
-            try:
-                data = response.json()
-                self.validate_user_data(data, user_id)
-                return self.transform_user_data(data, user_id)
-                
-            except json.JSONDecodeError as e:
-                raise DataProcessingException(
-                    f"Invalid JSON response for user {user_id}",
-                    "INVALID_JSON",
-                    ErrorSeverity.MEDIUM,
-                    recoverable=True,
-                    context={"user_id": user_id, "response_text": response.text[:500]},
-                    original_exception=e
-                )
-                
-        except requests.exceptions.Timeout as e:
+        except httpx.TimeoutException as e:
             raise NetworkError(
                 f"Timeout fetching user {user_id}",
-                f"{self.api_url}/users/{user_id}",
-                context={"user_id": user_id, "timeout": 10}
+                url,
+                context={"user_id": user_id, "connect_timeout": CONNECT_TIMEOUT, "read_timeout": READ_TIMEOUT}
             )
             
-        except requests.exceptions.ConnectionError as e:
+        except httpx.TransportError as e:
             raise NetworkError(
                 f"Connection error fetching user {user_id}",
-                f"{self.api_url}/users/{user_id}",
+                url,
                 context={"user_id": user_id}
             )
+        
+        handler = self._status_handlers.get(status_code // 100)
+        if handler:
+            handler(response, url, user_id)
+        
+        try:
+            # orjson parses straight from the raw bytes, skipping the str decode
+            data = orjson.loads(body)
+            self.validate_user_data(data, user_id)
+            return self.transform_user_data(data, user_id)
+            
+        except orjson.JSONDecodeError as e:
+            raise DataProcessingException(
+                f"Invalid JSON response for user {user_id}",
+                "INVALID_JSON",
+                ErrorSeverity.MEDIUM,
+                recoverable=True,
+                context={"user_id": user_id, "response_text": body[:500].decode("utf-8", "replace")},
+                original_exception=e
+            )
+    
+    def _on_4xx(self, response: httpx.Response, url: str, user_id: str) -> None:
+        """Raise for client errors; a 404 means the user doesn't exist and isn't retried"""
+        status_code = response.status_code
+        if status_code == 404:
+            raise DataProcessingException(
+                f"User {user_id} not found",
+                "USER_NOT_FOUND",
+                ErrorSeverity.LOW,
+                recoverable=False,
+                context={"user_id": user_id, "status_code": 404}
+            )
+        raise NetworkError(
+            f"Client error fetching user {user_id}: {response.text}",
+            url,
+            status_code,
+            {"user_id": user_id},
+            retry_after=self._retry_after(response)
+        )
+    
+    def _on_5xx(self, response: httpx.Response, url: str, user_id: str) -> None:
+        """Raise for server errors"""
+        raise NetworkError(
+            f"Server error fetching user {user_id}",
+            url,
+            response.status_code,
+            {"user_id": user_id},
+            retry_after=self._retry_after(response)
+        )
+    
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds from a Retry-After header (429/503); HTTP-date values are ignored"""
+        value = response.headers.get("Retry-After")
+        return float(value) if value and value.isdigit() else None
+    
+    def _headers_for(self, request_id: Optional[str]) -> Optional[Dict[str, str]]:
+        """Per-request headers, rebuilt only when the request ID changes"""
+        if request_id != self._request_id:
+            self._request_id = request_id
+            self._request_headers = {"X-Request-ID": request_id} if request_id else None
+        return self._request_headers
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive connection pool, created inside the running event loop"""
+        if self.client is None:
+            # Connections (and their TLS sessions) are reused across requests, and
+            # over HTTP/2 concurrent requests multiplex onto the same connection;
+            # timeouts and default headers are configured once, not per call
+            self.client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=POOL_MAX_SIZE,
+                    max_keepalive_connections=POOL_MAX_SIZE,
+                    keepalive_expiry=30
+                ),
+                timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+                headers={"User-Agent": "data-processor/1.0", "Accept-Encoding": "gzip"}
+            )
+        return self.client
     
     def validate_user_data(self, data: Dict, user_id: str) -> None:
         """Validate user data with detailed error reporting"""
-        validation_errors = []
+        validation_errors: List[Tuple[str, str]] = []
         
         if not isinstance(data, dict):
             raise ValidationError("User data must be a dictionary", "data_type", type(data).__name__)
         
         required_fields = ['email', 'name']
-        for field in required_fields:
-            if field not in data:
-                validation_errors.append(f"Missing required field: {field}")
-            elif not data[field] or not str(data[field]).strip():
-                validation_errors.append(f"Field {field} cannot be empty")
+        for field_name in required_fields:
+            if field_name not in data:
+                validation_errors.append((field_name, "missing required field"))
+            else:
+                value = data[field_name]
+                if not value or (isinstance(value, str) and not value.strip()):
+                    validation_errors.append((field_name, "cannot be empty"))
         
         if 'email' in data and data['email']:
             email = data['email']
-            if '@' not in email or '.' not in email.split('@')[-1]:
-                validation_errors.append(f"Invalid email format: {email}")
+            if not isinstance(email, str) or not self._EMAIL_RE.match(email):
+                validation_errors.append(("email", f"invalid format: {email}"))
         
         if 'age' in data and data['age'] is not None:
             try:
                 age = int(data['age'])
                 if age < 0 or age > 150:
-                    validation_errors.append(f"Age must be between 0 and 150, got: {age}")
+                    validation_errors.append(("age", f"must be between 0 and 150, got: {age}"))
             except (ValueError, TypeError):
-                validation_errors.append(f"Age must be a valid number, got: {data['age']}")
+                validation_errors.append(("age", f"must be a valid number, got: {data['age']}"))
         
         if validation_errors:
             raise ValidationError(
-                f"User data validation failed: {'; '.join(validation_errors)}",
+                None,
                 "multiple",
                 validation_errors,
                 {"user_id": user_id, "validation_errors": validation_errors}
@@ -375,33 +573,14 @@ class DataProcessor:
     def transform_user_data(self, data: Dict, user_id: str) -> Dict:
         """Transform user data with error handling"""
         try:
-            transformed = data.copy()
-            
-            # Safe date parsing
-            if 'created_date' in data and data['created_date']:
-                try:
-                    transformed['created_date'] = datetime.strptime(data['created_date'], '%Y-%m-%d')
-                except ValueError as e:
-                    self.logger.logger.warning(
-                        f"Invalid date format for user {user_id}: {data['created_date']}",
-                        extra={"user_id": user_id, "date_value": data['created_date']}
-                    )
-                    # Keep original value instead of failing
-                    transformed['created_date'] = data['created_date']
-            
-            # Safe JSON parsing for preferences
-            if 'preferences' in data and isinstance(data['preferences'], str):
-                try:
-                    transformed['preferences'] = json.loads(data['preferences'])
-                except json.JSONDecodeError as e:
-                    self.logger.logger.warning(
-                        f"Invalid preferences JSON for user {user_id}",
-                        extra={"user_id": user_id, "preferences": data['preferences']}
-                    )
-                    # Set default preferences instead of failing
-                    transformed['preferences'] = {}
-            
-            return transformed
+            # Project only the fields we emit instead of copying the whole payload
+            return {
+                "email": data["email"],
+                "name": data["name"],
+                "age": data.get("age"),
+                "created_date": self._parse_date(data.get("created_date"), user_id),
+                "preferences": self._parse_prefs(data.get("preferences"), user_id),
+            }
             
         except Exception as e:
             raise DataProcessingException(
@@ -412,13 +591,42 @@ class DataProcessor:
                 context={"user_id": user_id},
                 original_exception=e
             )
+    
+    def _parse_date(self, value, user_id: str):
+        """Parse an ISO date, keeping the original value if it can't be parsed"""
+        if not value:
+            return value
+        try:
+            # fromisoformat is C-implemented and skips strptime's format interpretation
+            return datetime.fromisoformat(value)
+        except ValueError:
+            self.logger.logger.warning(
+                "Invalid date format for user %s: %s", user_id, value,
+                extra={"user_id": user_id, "date_value": value}
+            )
+            return value
+    
+    def _parse_prefs(self, value, user_id: str):
+        """Decode JSON-encoded preferences, falling back to defaults if malformed"""
+        if not isinstance(value, str):
+            return value
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            self.logger.logger.warning(
+                "Invalid preferences JSON for user %s", user_id,
+                extra={"user_id": user_id, "preferences": value}
+            )
+            return {}
 
 class DatabaseConnection:
     """Database connection with robust error handling"""
     
+    _INSERT_SQL = "INSERT INTO records (key, data) VALUES (%s, %s)"
+    
     def __init__(self):
         self.connected = False
-        self.logger = StructuredLogger("database")
+        self.logger = get_structured_logger("database")
     
     def save_with_transaction(self, operations: List[Tuple[str, Dict]]) -> None:
         """Save multiple operations in a transaction"""
@@ -429,8 +637,7 @@ class DatabaseConnection:
             # Begin transaction
             self.begin_transaction()
             
-            for key, data in operations:
-                self.save(key, data)
+            self.save_many(operations)
             
             # Commit transaction
             self.commit_transaction()
@@ -445,24 +652,26 @@ class DatabaseConnection:
             )
     
     def save(self, key: str, data: Dict) -> None:
-        """Save data with proper error handling"""
+        """Save a single record"""
+        self.save_many([(key, data)])
+    
+    def save_many(self, rows: List[Tuple[str, Dict]]) -> None:
+        """Validate a batch up front and write it in one round trip"""
         try:
             if not self.connected:
                 self.connect()
             
-            # Simulate database save with validation
-            if not key:
-                raise DatabaseError("Key cannot be empty", "SAVE", context={"key": key})
+            self._validate_batch(rows)
             
-            if not isinstance(data, dict):
-                raise DatabaseError(
-                    "Data must be a dictionary", 
-                    "SAVE", 
-                    context={"key": key, "data_type": type(data).__name__}
-                )
+            params = [(key, orjson.dumps(data)) for key, data in rows]
+            self.executemany(self._INSERT_SQL, params)
             
-            # Simulate successful save
-            self.logger.log_success("database_save", {"key": key, "data_size": len(str(data))})
+            # Per-save records are debug-only; skip sizing the batch unless they're emitted
+            if self.logger.logger.isEnabledFor(logging.DEBUG):
+                self.logger.log_success("database_save", {
+                    "row_count": len(params),
+                    "data_size": sum(len(payload) for _, payload in params)
+                }, level=logging.DEBUG)
             
         except DatabaseError:
             raise  # Re-raise database errors
@@ -470,29 +679,47 @@ class DatabaseConnection:
             raise DatabaseError(
                 f"Unexpected database error: {str(e)}",
                 "SAVE",
-                context={"key": key},
+                context={"row_count": len(rows)},
+            )
+    
+    def _validate_batch(self, rows: List[Tuple[str, Dict]]) -> None:
+        """Raise a single DatabaseError describing every invalid row"""
+        invalid_rows = []
+        for key, data in rows:
+            if not key:
+                invalid_rows.append((key, "key cannot be empty"))
+            elif not isinstance(data, dict):
+                invalid_rows.append((key, f"data must be a dictionary, got {type(data).__name__}"))
+        
+        if invalid_rows:
+            raise DatabaseError(
+                f"{len(invalid_rows)} of {len(rows)} rows failed validation",
+                "SAVE",
+                context={"invalid_rows": invalid_rows}
             )
     
     def connect(self) -> None:
         """Connect to database with retry logic"""
         max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Simulate connection
-                self.connected = True
-                self.logger.log_success("database_connect", {"attempt": attempt + 1})
-                return
-                
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise DatabaseError(
-                        f"Failed to connect to database after {max_retries} attempts",
-                        "CONNECTION",
-                        context={"max_retries": max_retries}
-                    )
-                
-                time.sleep(2 ** attempt)  # Exponential backoff
+        attempts = 0
+        
+        def attempt() -> None:
+            nonlocal attempts
+            attempts += 1
+            # Simulate connection
+            self.connected = True
+            self.logger.log_success("database_connect", {"attempt": attempts})
+        
+        try:
+            _retry_sync(attempt, max_attempts=max_retries, retry_if=lambda e: True)
+        except Exception:
+            raise DatabaseError(
+                f"Failed to connect to database after {max_retries} attempts",
+                "CONNECTION",
+                context={"max_retries": max_retries}
+            )
     
+    def executemany(self, sql: str, params: List[Tuple]): pass
     def begin_transaction(self): pass
     def commit_transaction(self): pass
     def rollback_transaction(self): pass
@@ -500,25 +727,42 @@ class DatabaseConnection:
 class MetricsCollector:
     """Metrics collection with error handling"""
     
+    FLUSH_INTERVAL = 5.0  # seconds between aggregated error metric records
+    
     def __init__(self):
-        self.logger = StructuredLogger("metrics")
+        self.logger = get_structured_logger("metrics")
+        self._counts: Counter = Counter()
+        self._last_flush = time.monotonic()
     
     def record_error(self, error_type: str, severity: ErrorSeverity) -> None:
         """Record error metrics"""
         try:
-            # Simulate metrics recording
-            self.logger.log_success("metrics_recorded", {
-                "metric_type": "error",
-                "error_type": error_type,
-                "severity": severity.value
-            })
+            # Coalesce into counters so an error storm produces one record per interval
+            self._counts[(error_type, _SEV_STR[severity])] += 1
+            if time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+                self._flush()
         except Exception as e:
             # Don't fail the main operation for metrics errors
             self.logger.logger.warning(f"Failed to record error metrics: {e}")
     
+    def _flush(self) -> None:
+        """Emit the aggregated error counts and start a new interval"""
+        self._last_flush = time.monotonic()
+        if not self._counts:
+            return
+        counts = {f"{error_type}:{severity}": count
+                  for (error_type, severity), count in self._counts.items()}
+        self._counts.clear()
+        self.logger.log_success("metrics_recorded", {
+            "metric_type": "error",
+            "error_counts": counts
+        })
+    
     def record_processing_result(self, result: ProcessingResult) -> None:
         """Record processing result metrics"""
         try:
+            # End of batch: don't leave this run's error counts waiting for the next interval
+            self._flush()
             self.logger.log_success("processing_metrics_recorded", {
                 "processed_count": result.processed_count,
                 "failed_count": result.failed_count,
@@ -532,7 +776,7 @@ class CacheService:
     """Cache service with graceful failure handling"""
     
     def __init__(self):
-        self.logger = StructuredLogger("cache")
+        self.logger = get_structured_logger("cache")
     
     def get(self, key: str) -> Optional[any]:
         """Get from cache with error handling"""
@@ -547,22 +791,21 @@ class CacheService:
         """Set cache with error handling"""
         try:
             # Simulate cache set
-            self.logger.log_success("cache_set", {"key": key, "ttl": ttl})
+            self.logger.log_success("cache_set", {"key": key, "ttl": ttl}, level=logging.DEBUG)
         except Exception as e:
             # Cache failures shouldn't break the main flow
             self.logger.logger.warning(f"Cache set failed for key {key}: {e}")
 
 # Usage demonstrates robust error handling
-def main():
+async def main():
     """Demonstrates comprehensive error handling approach"""
-    processor = DataProcessor()
-    
     # Process with request tracking
     request_id = f"req_{int(time.time())}"
     user_ids = ['user1', 'user2', 'invalid_user', 'user4', 'user5']
     
     try:
-        result = processor.process_user_data(user_ids, request_id)
+        async with DataProcessor() as processor:
+            result = await processor.process_user_data(user_ids, request_id)
         
         print(f"Processing completed:")
         print(f"  Success: {result.success}")
@@ -577,14 +820,14 @@ def main():
                 if error.user_id:
                     print(f"      User: {error.user_id}")
                 if error.severity:
-                    print(f"      Severity: {error.severity.value}")
+                    print(f"      Severity: {_SEV_STR[error.severity]}")
         
     except Exception as e:
         print(f"Critical error: {e}")
         # Even critical errors are logged with context
 
 if __name__ == "__main__":
-    main()
+    uvloop.run(main())
 
 # Benefits of robust error handling:
 print("\nBenefits of robust error handling:")
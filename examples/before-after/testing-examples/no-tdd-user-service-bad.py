@@ -2,11 +2,175 @@
 # Problems: No tests, unclear requirements, hidden bugs, hard to modify
 
 import hashlib
+import hmac
 import re
+import secrets
 import smtplib
-from datetime import datetime, timedelta
+import ssl
+from datetime import datetime
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from email.mime.text import MimeText
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+try:
+    # google-re2 compiles patterns to a DFA: linear time, no backtracking
+    import re2
+    _compile = re2.compile
+except ImportError:
+    def _compile(expr):
+        return re.compile(expr, re.ASCII)
+
+@lru_cache(maxsize=None)
+def _pat(expr):
+    """Compile each validator pattern once per process; call sites never pick the engine"""
+    return _compile(expr)
+
+# The email pattern is bound at import for the registration hot path. It is
+# unanchored and applied with fullmatch: `$` also matches before a trailing
+# newline in re but not in re2, so anchors would make the engines disagree
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_EMAIL_RE = _pat(_EMAIL_PATTERN)
+
+# Argon2id with RFC 9106 second-tier parameters: deliberately slow and memory-hard
+_PH = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+
+# Built once so the system CA bundle is parsed at import, not on every STARTTLS
+_SMTP_CTX = ssl.create_default_context()
+
+def _verify_password(stored_hash, password):
+    """Check a password against an Argon2 hash or a legacy SHA-256 hex digest"""
+    if stored_hash.startswith("$argon2"):
+        try:
+            return _PH.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Accounts created before the Argon2 switch still carry unsalted SHA-256 hex;
+    # compare the raw 32-byte digests in constant time so the mismatch position
+    # doesn't leak through timing
+    try:
+        stored_digest = bytes.fromhex(stored_hash)
+    except ValueError:
+        return False
+    password_digest = hashlib.sha256(password.encode('utf-8', 'strict')).digest()
+    return hmac.compare_digest(password_digest, stored_digest)
+
+# Timestamps are integer microseconds since the epoch; time_ns() hands back a
+# plain int without building a datetime, which only happens at the API boundary
+_LOCK_DURATION_US = 24 * 3600 * 1_000_000
+
+def _now_us():
+    return time.time_ns() // 1000
+
+def _needs_rehash(stored_hash):
+    """Legacy digests and Argon2 hashes with outdated parameters get upgraded on login"""
+    return not stored_hash.startswith("$argon2") or _PH.check_needs_rehash(stored_hash)
+
+# Validation rules live in pure functions so registration and password changes
+# apply the same checks
+def validate_password(password):
+    """Raise ValueError if the password breaks the (only) password rule"""
+    if len(password) < 8:
+        raise ValueError("Password too short")
+
+def validate_credentials(email, password):
+    """Raise ValueError for a missing or malformed email or password"""
+    if not email:
+        raise ValueError("Email required")
+    
+    if not password:
+        raise ValueError("Password required")
+    
+    # Email validation - regex found on Stack Overflow
+    if not _EMAIL_RE.fullmatch(email):
+        raise ValueError("Invalid email format")
+    
+    validate_password(password)
+
+# SQL lives in module constants: one definition per statement, and every call
+# hands sqlite3 the identical string so its per-connection statement cache hits
+
+# Connection-scoped settings, applied to every pooled connection in one script
+_PRAGMAS_PER_CONNECTION = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA foreign_keys=ON;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;  -- ~20 MB page cache
+'''
+_USERS_COLUMNS = '''(
+        id INTEGER PRIMARY KEY,
+        email TEXT UNIQUE,
+        password_hash TEXT,
+        first_name TEXT,
+        last_name TEXT,
+        created_at INTEGER,  -- unix microseconds
+        email_verified BOOLEAN DEFAULT 0,
+        verification_token TEXT,
+        failed_login_attempts INTEGER DEFAULT 0,
+        locked_until INTEGER  -- unix microseconds
+    )'''
+# Run once per database file: WAL mode is persistent, and the DDL is idempotent
+_SQL_SETUP = f'''
+    PRAGMA journal_mode=WAL;  -- readers proceed while a writer holds the lock
+    CREATE TABLE IF NOT EXISTS users {_USERS_COLUMNS};
+'''
+# Databases created before the switch to microseconds declare both columns TEXT and
+# hold local-time ISO strings. TEXT affinity would turn integers written there back
+# into strings, so the table is rebuilt with the current schema and the values converted
+_SQL_HAS_LEGACY_TIMESTAMPS = (
+    "SELECT 1 FROM pragma_table_info('users') WHERE name = 'created_at' AND type = 'TEXT'"
+)
+# Whole seconds via strftime, plus the ISO string's own microsecond digits (if any)
+_ISO_TO_US = "(strftime('%s', {0}, 'utc') * 1000000 + CAST(substr({0}, 21) AS INTEGER))"
+_SQL_MIGRATE_TIMESTAMPS = f'''
+    BEGIN IMMEDIATE;
+    CREATE TABLE users_migrated {_USERS_COLUMNS};
+    INSERT INTO users_migrated
+        SELECT id, email, password_hash, first_name, last_name, {_ISO_TO_US.format('created_at')},
+               email_verified, verification_token, failed_login_attempts, {_ISO_TO_US.format('locked_until')}
+        FROM users;
+    DROP TABLE users;
+    ALTER TABLE users_migrated RENAME TO users;
+    COMMIT;
+'''
+_SQL_CREATE_INDEXES = '''
+    CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users(email);
+    -- Partial: verified users have a NULL token and stay out of the index. New name,
+    -- so databases holding the earlier non-unique ix_users_vtoken still get the constraint
+    DROP INDEX IF EXISTS ix_users_vtoken;
+    CREATE UNIQUE INDEX IF NOT EXISTS ix_users_vtoken_pending ON users(verification_token)
+        WHERE verification_token IS NOT NULL;
+'''
+_SQL_INSERT_USER = (
+    "INSERT INTO users (email, password_hash, first_name, last_name, created_at, verification_token) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(email) DO NOTHING RETURNING id"
+)
+_SQL_SELECT_LOGIN = (
+    "SELECT id, password_hash, email_verified, "
+    "CASE WHEN locked_until IS NOT NULL AND locked_until > ? THEN 1 ELSE 0 END AS is_locked, "
+    "email, first_name, last_name, created_at "
+    "FROM users WHERE email = ?"
+)
+_SQL_RECORD_FAILED = (
+    "UPDATE users SET failed_login_attempts = failed_login_attempts + 1, "
+    "locked_until = CASE WHEN failed_login_attempts + 1 >= 5 THEN ? ELSE locked_until END "
+    "WHERE id = ?"
+)
+_SQL_RESET_FAILED = "UPDATE users SET failed_login_attempts = 0, locked_until = NULL WHERE id = ?"
+_SQL_SELECT_BY_TOKEN = "SELECT id, email FROM users WHERE verification_token = ?"
+_SQL_MARK_VERIFIED = "UPDATE users SET email_verified = 1, verification_token = NULL WHERE id = ?"
+_SQL_SELECT_PASSWORD_HASH = "SELECT password_hash FROM users WHERE id = ?"
+_SQL_UPDATE_PASSWORD = "UPDATE users SET password_hash = ? WHERE id = ?"
+_SQL_SELECT_PENDING_VERIFICATIONS = (
+    "SELECT email, verification_token FROM users WHERE verification_token IS NOT NULL"
+)
 
 class UserService:
     """
@@ -14,88 +178,94 @@ class UserService:
     Requirements discovered through production bugs and customer complaints
     """
     
-    def __init__(self):
+    # Database files whose schema has already been set up in this process
+    _INITIALIZED_DB_PATHS = set()
+    
+    def __init__(self, pool_size=4):
         # Direct database dependency - can't test without real DB
         self.db_path = "users.db"
+        # Connections are opened once and reused, keeping SQLite's page cache warm
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._open_connection())
+        # SMTP round trips happen here instead of on the caller's thread
+        self._mail_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mail")
+        # One long-lived SMTP session per mail worker, so the workers send in parallel;
+        # every session is also listed so close() can quit them all
+        self._smtp_local = threading.local()
+        self._smtp_sessions = []
+        self._smtp_sessions_lock = threading.Lock()
         self._setup_database()
     
+    def _open_connection(self):
+        # Autocommit: single statements commit on their own, and multi-statement
+        # writes open their transaction explicitly through _write_transaction
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.executescript(_PRAGMAS_PER_CONNECTION)
+        return conn
+    
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection, rolling back anything left uncommitted"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+    
+    @staticmethod
+    @contextmanager
+    def _write_transaction(conn):
+        """BEGIN IMMEDIATE takes the write lock up front instead of upgrading mid-transaction"""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
     def _setup_database(self):
         # Database setup in constructor - what could go wrong?
-        conn = sqlite3.connect(self.db_path)
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY,
-                email TEXT UNIQUE,
-                password_hash TEXT,
-                first_name TEXT,
-                last_name TEXT,
-                created_at TEXT,
-                email_verified BOOLEAN DEFAULT 0,
-                verification_token TEXT,
-                failed_login_attempts INTEGER DEFAULT 0,
-                locked_until TEXT
-            )
-        ''')
-        conn.close()
+        if self.db_path in UserService._INITIALIZED_DB_PATHS:
+            return
+        with self._conn() as conn:
+            conn.executescript(_SQL_SETUP)
+            if conn.execute(_SQL_HAS_LEGACY_TIMESTAMPS).fetchone():
+                conn.executescript(_SQL_MIGRATE_TIMESTAMPS)
+            conn.executescript(_SQL_CREATE_INDEXES)
+        UserService._INITIALIZED_DB_PATHS.add(self.db_path)
     
     def register_user(self, email, password, first_name, last_name):
         """
         Register a new user - seems simple but full of edge cases
         """
-        # Input validation - but is it enough?
-        if not email:
-            raise ValueError("Email required")
-        
-        if not password:
-            raise ValueError("Password required")
-            
-        # Email validation - regex found on Stack Overflow
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
-            raise ValueError("Invalid email format")
-        
-        # Password validation - requirements not clear
-        if len(password) < 8:
-            raise ValueError("Password too short")
+        # Input validation - but is it enough? Password requirements still not clear
+        validate_credentials(email, password)
         
         # What about other password requirements?
-        # What about SQL injection?
-        # What about duplicate emails?
         
-        # Hash password - is this secure enough?
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        # Hash password - Argon2id, salted and memory-hard
+        password_hash = _PH.hash(password)
         
-        # Generate verification token - is this random enough?
-        verification_token = hashlib.md5(f"{email}{datetime.now()}".encode()).hexdigest()
+        # Generate verification token - 32 bytes from the OS CSPRNG, not guessable from email + time
+        verification_token = secrets.token_urlsafe(32)
         
-        # Database operations - no transaction management
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Check for existing user - race condition possible
-            cursor = conn.execute("SELECT id FROM users WHERE email = ?", (email,))
-            if cursor.fetchone():
+        # Database operations - rolled back if anything below raises
+        with self._conn() as conn, self._write_transaction(conn):
+            # Insert new user; the UNIQUE email constraint makes the duplicate check atomic
+            cursor = conn.execute(_SQL_INSERT_USER, (email, password_hash, first_name, last_name, 
+                                                     _now_us(), verification_token))
+            if cursor.fetchone() is None:
                 raise ValueError("User already exists")
-            
-            # Insert new user
-            conn.execute('''
-                INSERT INTO users (email, password_hash, first_name, last_name, 
-                                 created_at, verification_token)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (email, password_hash, first_name, last_name, 
-                  datetime.now().isoformat(), verification_token))
-            
-            conn.commit()
-            
-            # Send verification email - what if this fails?
-            self._send_verification_email(email, verification_token)
-            
-            return {"message": "User registered successfully", "email": email}
-            
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        
+        # Send verification email in the background; a pending verification_token
+        # doubles as the marker resend_pending_verification_emails() picks up
+        self._mail_pool.submit(self._send_verification_email, email, verification_token)
+        
+        return {"message": "User registered successfully", "email": email}
     
     def login_user(self, email, password):
         """
@@ -104,78 +274,58 @@ class UserService:
         if not email or not password:
             raise ValueError("Email and password required")
         
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Get user data
-            cursor = conn.execute('''
-                SELECT id, password_hash, email_verified, failed_login_attempts, 
-                       locked_until FROM users WHERE email = ?
-            ''', (email,))
-            
-            user_data = cursor.fetchone()
-            if not user_data:
-                # Should we reveal that user doesn't exist? Security implications?
-                raise ValueError("Invalid credentials")
-            
-            user_id, stored_hash, email_verified, failed_attempts, locked_until = user_data
-            
-            # Check if account is locked
-            if locked_until:
-                locked_until_dt = datetime.fromisoformat(locked_until)
-                if datetime.now() < locked_until_dt:
-                    raise ValueError("Account is locked")
-            
-            # Check if email is verified
-            if not email_verified:
-                raise ValueError("Email not verified")
-            
-            # Verify password
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-            if password_hash != stored_hash:
-                # Increment failed attempts
-                new_failed_attempts = failed_attempts + 1
-                
-                # Lock account after 5 failed attempts
-                if new_failed_attempts >= 5:
-                    locked_until = (datetime.now() + timedelta(hours=24)).isoformat()
-                    conn.execute('''
-                        UPDATE users SET failed_login_attempts = ?, locked_until = ?
-                        WHERE id = ?
-                    ''', (new_failed_attempts, locked_until, user_id))
-                else:
-                    conn.execute('''
-                        UPDATE users SET failed_login_attempts = ?
-                        WHERE id = ?
-                    ''', (new_failed_attempts, user_id))
-                
-                conn.commit()
-                raise ValueError("Invalid credentials")
+        # Timestamps are integer microseconds, so the lock check is an integer
+        # compare inside SQLite rather than a date parse in Python
+        now_us = _now_us()
+        
+        # Get user data; SQLite decides whether the lock is still active. The pooled
+        # connection goes back before any Argon2 work, so hashing never starves the pool
+        with self._conn() as conn:
+            user_data = conn.execute(_SQL_SELECT_LOGIN, (now_us, email)).fetchone()
+        
+        if not user_data:
+            # Should we reveal that user doesn't exist? Security implications?
+            raise ValueError("Invalid credentials")
+        
+        (user_id, stored_hash, email_verified, is_locked,
+         user_email, first_name, last_name, created_at) = user_data
+        
+        # Check if account is locked
+        if is_locked:
+            raise ValueError("Account is locked")
+        
+        # Check if email is verified
+        if not email_verified:
+            raise ValueError("Email not verified")
+        
+        # Verify password
+        if not _verify_password(stored_hash, password):
+            # Increment failed attempts and lock after 5 in one statement;
+            # SQLite reads the current count, so concurrent failures can't
+            # overwrite each other's increment
+            locked_until = now_us + _LOCK_DURATION_US
+            with self._conn() as conn:
+                conn.execute(_SQL_RECORD_FAILED, (locked_until, user_id))
+            raise ValueError("Invalid credentials")
+        
+        # Upgrade legacy or outdated hashes while we have the plaintext
+        new_hash = _PH.hash(password) if _needs_rehash(stored_hash) else None
+        
+        with self._conn() as conn, self._write_transaction(conn):
+            if new_hash is not None:
+                conn.execute(_SQL_UPDATE_PASSWORD, (new_hash, user_id))
             
             # Reset failed attempts on successful login
-            conn.execute('''
-                UPDATE users SET failed_login_attempts = 0, locked_until = NULL
-                WHERE id = ?
-            ''', (user_id,))
-            
-            conn.commit()
-            
-            # Return user info - but what should we include?
-            cursor = conn.execute('''
-                SELECT id, email, first_name, last_name, created_at
-                FROM users WHERE id = ?
-            ''', (user_id,))
-            
-            user_info = cursor.fetchone()
-            return {
-                "id": user_info[0],
-                "email": user_info[1],
-                "first_name": user_info[2],
-                "last_name": user_info[3],
-                "created_at": user_info[4]
-            }
-            
-        finally:
-            conn.close()
+            conn.execute(_SQL_RESET_FAILED, (user_id,))
+        
+        # Return user info from the row we already fetched - but what should we include?
+        return {
+            "id": user_id,
+            "email": user_email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "created_at": datetime.fromtimestamp(created_at / 1_000_000).isoformat()
+        }
     
     def verify_email(self, token):
         """
@@ -184,12 +334,9 @@ class UserService:
         if not token:
             raise ValueError("Token required")
         
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._conn() as conn:
             # Find user by token
-            cursor = conn.execute('''
-                SELECT id, email FROM users WHERE verification_token = ?
-            ''', (token,))
+            cursor = conn.execute(_SQL_SELECT_BY_TOKEN, (token,))
             
             user_data = cursor.fetchone()
             if not user_data:
@@ -198,17 +345,9 @@ class UserService:
             user_id, email = user_data
             
             # Update user as verified
-            conn.execute('''
-                UPDATE users SET email_verified = 1, verification_token = NULL
-                WHERE id = ?
-            ''', (user_id,))
-            
-            conn.commit()
+            conn.execute(_SQL_MARK_VERIFIED, (user_id,))
             
             return {"message": "Email verified successfully", "email": email}
-            
-        finally:
-            conn.close()
     
     def change_password(self, user_id, old_password, new_password):
         """
@@ -217,53 +356,59 @@ class UserService:
         if not all([user_id, old_password, new_password]):
             raise ValueError("All fields required")
         
-        # Password validation - duplicated from registration
-        if len(new_password) < 8:
-            raise ValueError("Password too short")
+        # Password validation - same rule as registration
+        validate_password(new_password)
         
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Get current password hash
-            cursor = conn.execute('''
-                SELECT password_hash FROM users WHERE id = ?
-            ''', (user_id,))
-            
-            result = cursor.fetchone()
-            if not result:
-                raise ValueError("User not found")
-            
-            stored_hash = result[0]
-            
-            # Verify old password
-            old_password_hash = hashlib.sha256(old_password.encode()).hexdigest()
-            if old_password_hash != stored_hash:
-                raise ValueError("Current password is incorrect")
-            
-            # Hash new password
-            new_password_hash = hashlib.sha256(new_password.encode()).hexdigest()
-            
-            # Update password
-            conn.execute('''
-                UPDATE users SET password_hash = ? WHERE id = ?
-            ''', (new_password_hash, user_id))
-            
-            conn.commit()
-            
-            return {"message": "Password changed successfully"}
-            
-        finally:
-            conn.close()
+        # Get current password hash; the connection is returned before Argon2 runs
+        with self._conn() as conn:
+            result = conn.execute(_SQL_SELECT_PASSWORD_HASH, (user_id,)).fetchone()
+        
+        if not result:
+            raise ValueError("User not found")
+        
+        stored_hash = result[0]
+        
+        # Verify old password
+        if not _verify_password(stored_hash, old_password):
+            raise ValueError("Current password is incorrect")
+        
+        # Hash new password
+        new_password_hash = _PH.hash(new_password)
+        
+        # Update password
+        with self._conn() as conn:
+            conn.execute(_SQL_UPDATE_PASSWORD, (new_password_hash, user_id))
+        
+        return {"message": "Password changed successfully"}
+    
+    def resend_pending_verification_emails(self):
+        """
+        Re-queue verification emails for every account still holding a token
+        (e.g. after a crash lost queued sends)
+        """
+        with self._conn() as conn:
+            pending = conn.execute(_SQL_SELECT_PENDING_VERIFICATIONS).fetchall()
+        
+        for email, token in pending:
+            self._mail_pool.submit(self._send_verification_email, email, token)
+        
+        return len(pending)
+    
+    def close(self):
+        """Finish queued emails and close pooled connections"""
+        self._mail_pool.shutdown(wait=True)
+        with self._smtp_sessions_lock:
+            sessions, self._smtp_sessions = self._smtp_sessions, []
+        for smtp in sessions:
+            self._quit_smtp(smtp)
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
     
     def _send_verification_email(self, email, token):
         """
         Send verification email - what if SMTP is down?
         """
         try:
-            # Hard-coded SMTP configuration
-            smtp_server = smtplib.SMTP('smtp.gmail.com', 587)
-            smtp_server.starttls()
-            smtp_server.login('noreply@company.com', 'app_password')
-            
             # Create email
             verification_url = f"https://company.com/verify?token={token}"
             body = f"Click here to verify your email: {verification_url}"
@@ -273,13 +418,58 @@ class UserService:
             msg['From'] = 'noreply@company.com'
             msg['To'] = email
             
-            smtp_server.send_message(msg)
-            smtp_server.quit()
+            try:
+                self._smtp_connection().send_message(msg)
+            except Exception:
+                # Don't reuse a session that failed mid-send
+                self._drop_smtp()
+                raise
             
         except Exception as e:
             # What should happen if email fails? Silent failure?
             print(f"Failed to send verification email: {e}")
             # Should this prevent user registration?
+    
+    def _smtp_connection(self):
+        """
+        Return this worker thread's SMTP session, reconnecting if a NOOP shows it dropped
+        """
+        smtp = getattr(self._smtp_local, "session", None)
+        if smtp is not None:
+            try:
+                if smtp.noop()[0] == 250:
+                    return smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_smtp()
+        
+        # Hard-coded SMTP configuration - TLS handshake and AUTH now paid once per session
+        smtp_server = smtplib.SMTP('smtp.gmail.com', 587)
+        smtp_server.starttls(context=_SMTP_CTX)
+        smtp_server.login('noreply@company.com', 'app_password')
+        self._smtp_local.session = smtp_server
+        with self._smtp_sessions_lock:
+            self._smtp_sessions.append(smtp_server)
+        return smtp_server
+    
+    def _drop_smtp(self):
+        """Close this worker thread's SMTP session, if any"""
+        smtp = getattr(self._smtp_local, "session", None)
+        if smtp is None:
+            return
+        self._smtp_local.session = None
+        with self._smtp_sessions_lock:
+            if smtp in self._smtp_sessions:
+                self._smtp_sessions.remove(smtp)
+        self._quit_smtp(smtp)
+    
+    @staticmethod
+    def _quit_smtp(smtp):
+        """Close an SMTP session, ignoring errors"""
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
 
 # Example usage - no tests to verify this works
 if __name__ == "__main__":
@@ -308,20 +498,15 @@ if __name__ == "__main__":
 Problems with this approach:
 1. ❌ No tests to verify correctness
 2. ❌ Complex business logic without validation
-3. ❌ Database operations not transactional
-4. ❌ Hard dependencies on database and email service
-5. ❌ Security vulnerabilities (weak hashing, timing attacks)
-6. ❌ Race conditions in user registration
-7. ❌ Error handling inconsistent and unclear
-8. ❌ No separation of concerns (DB, email, validation all mixed)
-9. ❌ Hard-coded configuration values
-10. ❌ Silent failures in email sending
-11. ❌ Duplicated validation logic
-12. ❌ No input sanitization for SQL injection
-13. ❌ Unclear error messages that may leak information
-14. ❌ No logging or monitoring
-15. ❌ Impossible to unit test individual components
-16. ❌ Changes require full integration testing
-17. ❌ Production bugs discovered by users
-18. ❌ Code is fragile and scary to modify
+3. ❌ Hard dependencies on database and email service
+4. ❌ Error handling inconsistent and unclear
+5. ❌ No separation of concerns (DB, email, validation all mixed)
+6. ❌ Hard-coded configuration values
+7. ❌ Silent failures in email sending
+8. ❌ Unclear error messages that may leak information
+9. ❌ No logging or monitoring
+10. ❌ Impossible to unit test individual components
+11. ❌ Changes require full integration testing
+12. ❌ Production bugs discovered by users
+13. ❌ Code is fragile and scary to modify
 """
@@ -2,17 +2,118 @@
 # Benefits: Clear requirements, comprehensive tests, easy to modify and extend
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
-import re
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+import asyncio
+import os
 import secrets
+import string
 import hashlib
-import bcrypt
+import math
+import time
+
+# Both hashers are native code; whichever is installed backs create_password_hasher()
+try:
+    import bcrypt
+except ImportError:
+    bcrypt = None
+try:
+    import argon2
+except ImportError:
+    argon2 = None
+
+# Optional: compiles the password class scan for bulk imports
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Email character classes as str.translate deletion tables: a segment is valid
+# when translating it leaves nothing behind
+_EMAIL_LOCAL_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '.-')
+_EMAIL_TLD_CHARS = str.maketrans('', '', string.ascii_letters)
+
+# Password character classes, reported as bits by _scan_password_classes
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_ALL_CLASSES = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+
+# Deletion tables: a translated password that came out shorter contained the class
+_NO_UPPER = str.maketrans('', '', string.ascii_uppercase)
+_NO_LOWER = str.maketrans('', '', string.ascii_lowercase)
+_NO_DIGIT = str.maketrans('', '', string.digits)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_password_batch_bytes(data, offsets, masks) -> None:
+        """Fill masks[i] with the classes in data[offsets[i]:offsets[i + 1]], one byte at a time"""
+        for i in range(len(masks)):
+            mask = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                b = data[j]
+                if 65 <= b <= 90:
+                    mask |= _HAS_UPPER
+                elif 97 <= b <= 122:
+                    mask |= _HAS_LOWER
+                elif 48 <= b <= 57:
+                    mask |= _HAS_DIGIT
+            masks[i] = mask
+else:
+    _scan_password_batch_bytes = None
+
+
+def _scan_password_classes(password: str) -> int:
+    """Bit mask of the character classes present in the password"""
+    # The translate tables only know ASCII digits, so Unicode passwords take
+    # the per-character loop below
+    if password.isascii():
+        length = len(password)
+        return ((_HAS_UPPER if len(password.translate(_NO_UPPER)) != length else 0)
+                | (_HAS_LOWER if len(password.translate(_NO_LOWER)) != length else 0)
+                | (_HAS_DIGIT if len(password.translate(_NO_DIGIT)) != length else 0))
+    
+    # One pass, stopping as soon as every class has been seen
+    mask = 0
+    for c in password:
+        if 'A' <= c <= 'Z':
+            mask |= _HAS_UPPER
+        elif 'a' <= c <= 'z':
+            mask |= _HAS_LOWER
+        elif c.isdecimal():
+            mask |= _HAS_DIGIT
+        else:
+            continue
+        if mask == _ALL_CLASSES:
+            break
+    return mask
+
+
+def _scan_password_classes_batch(passwords: List[str]) -> List[int]:
+    """_scan_password_classes for many passwords; with numba, one compiled call covers the ASCII ones"""
+    if _scan_password_batch_bytes is None:
+        return [_scan_password_classes(password) if password else 0 for password in passwords]
+    
+    # Packed into one buffer so the JIT call overhead is paid once per batch;
+    # missing and Unicode passwords get an empty slot here
+    encoded = [password.encode('ascii') if password and password.isascii() else b''
+               for password in passwords]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(data) for data in encoded], dtype=np.int64)
+    masks = np.zeros(len(encoded), dtype=np.int64)
+    _scan_password_batch_bytes(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets, masks)
+    return [int(mask) if not password or password.isascii() else _scan_password_classes(password)
+            for password, mask in zip(passwords, masks)]
 
 
 # Domain models - clear data structures
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[str]
     email: str
@@ -21,27 +122,79 @@ class User:
     created_at: datetime
     email_verified: bool = False
     failed_login_attempts: int = 0
-    locked_until: Optional[datetime] = None
+    locked_until: Optional[float] = None  # Unix seconds
+    password_hash: Optional[bytes] = None  # ASCII hash, kept encoded for the hasher
 
-@dataclass
+@dataclass(slots=True)
 class RegistrationResult:
     success: bool
     user_id: Optional[str] = None
     message: Optional[str] = None
     verification_token: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class LoginResult:
     success: bool
     user: Optional[User] = None
     message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     success: bool
     message: str
 
 
+# Probabilistic set - answers "definitely not present" without touching storage
+class BloomFilter:
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        # Standard sizing: m = -n ln p / (ln 2)^2 bits and k = m/n ln 2 hash functions
+        self._size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+    
+    def _positions(self, item: str):
+        # Double hashing: k positions from the two halves of a single digest
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hash_count))
+    
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+# Bounded cache whose entries also expire - keeps hot records close for a short window
+class ExpiringLRUCache:
+    def __init__(self, maxsize: int = 4096, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
 # Interface definitions - testable boundaries
 class UserRepository(ABC):
     @abstractmethod
@@ -72,12 +225,16 @@ class TokenGenerator(ABC):
 
 class PasswordHasher(ABC):
     @abstractmethod
-    def hash_password(self, password: str) -> str:
+    def hash_password(self, password: str) -> bytes:
         pass
     
     @abstractmethod
-    def verify_password(self, password: str, hashed: str) -> bool:
+    def verify_password(self, password: str, hashed: bytes) -> bool:
         pass
+    
+    def hash_passwords_batch(self, passwords: List[str], executor: Executor) -> List[bytes]:
+        """Hash on the caller's pool; native hashers release the GIL while they work"""
+        return list(executor.map(self.hash_password, passwords))
 
 
 # Main service - pure business logic
@@ -92,68 +249,105 @@ class UserService:
         self.token_generator = token_generator
         self.password_hasher = password_hasher
         
+        # Emails known to the repository; None until track_known_emails() seeds it
+        self._known_emails: Optional[BloomFilter] = None
+        # Users recently loaded for login, by normalized email; dropped on every update
+        self._user_cache = ExpiringLRUCache(maxsize=4096, ttl=5.0)
+        # Verified against on unknown emails so they cost as much as a wrong password;
+        # hashed once here rather than per login
+        self._dummy_hash = password_hasher.hash_password('x' * 16)
+        # register_user_async and register_users_bulk hashing run here; released by close()
+        self._hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="hash")
+        
         # Configuration
         self.max_failed_attempts = 5
         self.lockout_duration_hours = 24
         self.min_password_length = 8
 
+    @property
+    def _lockout_seconds(self) -> int:
+        # Derived on use so later changes to lockout_duration_hours take effect
+        return self.lockout_duration_hours * 3600
+
+    def close(self) -> None:
+        """Shut down the hashing pool"""
+        self._hash_pool.shutdown(wait=True)
+
+    def __enter__(self) -> "UserService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def register_user(self, email: str, password: str, first_name: str, last_name: str) -> RegistrationResult:
         """Register a new user with email verification"""
         
-        # Validate inputs
-        validation_error = self._validate_registration_input(email, password, first_name, last_name)
-        if validation_error:
-            return RegistrationResult(success=False, message=validation_error)
-        
-        # Check if user already exists
-        existing_user = self.user_repository.find_by_email(email)
-        if existing_user:
-            return RegistrationResult(success=False, message="User already exists with this email")
-        
-        # Create user
-        user = User(
-            id=None,  # Will be set by repository
-            email=email.lower().strip(),
-            first_name=first_name.strip(),
-            last_name=last_name.strip(),
-            created_at=datetime.now()
-        )
+        user, error = self._new_user(email, password, first_name, last_name, datetime.now())
+        if error:
+            return RegistrationResult(success=False, message=error)
         
         # Hash password
         user.password_hash = self.password_hasher.hash_password(password)
         
-        # Save user
-        user_id = self.user_repository.save_user(user)
-        
-        # Generate and send verification email
-        verification_token = self.token_generator.generate_token()
-        email_sent = self.email_service.send_verification_email(email, verification_token)
-        
-        if not email_sent:
-            return RegistrationResult(
-                success=False, 
-                message="User created but verification email failed"
-            )
-        
-        return RegistrationResult(
-            success=True,
-            user_id=user_id,
-            verification_token=verification_token,
-            message="User registered successfully. Please check your email for verification."
+        return self._save_and_send_verification(user)
+
+    async def register_user_async(self, email: str, password: str, first_name: str, last_name: str) -> RegistrationResult:
+        """Register a new user without blocking the event loop"""
+        
+        # The repository and email service are synchronous as well as the hasher,
+        # so the whole registration runs on the pool rather than just the hashing
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._hash_pool, self.register_user, email, password, first_name, last_name
         )
 
+    def register_users_bulk(self, registrations: List[Tuple[str, str, str, str]]) -> List[RegistrationResult]:
+        """Register many (email, password, first_name, last_name) entries, hashing all passwords concurrently"""
+        
+        results: List[Optional[RegistrationResult]] = [None] * len(registrations)
+        accepted = []
+        seen_emails = set()
+        now = datetime.now()  # One creation time for the whole batch
+        password_classes = _scan_password_classes_batch([password for _, password, _, _ in registrations])
+        for index, (email, password, first_name, last_name) in enumerate(registrations):
+            user, error = self._new_user(email, password, first_name, last_name, now,
+                                         password_classes[index])
+            if not error and user.email in seen_emails:
+                error = "User already exists with this email"
+            if error:
+                results[index] = RegistrationResult(success=False, message=error)
+                continue
+            seen_emails.add(user.email)
+            accepted.append((index, user, password))
+        
+        # Hashing is the expensive part and runs in parallel; repository writes stay serial
+        hashes = self.password_hasher.hash_passwords_batch(
+            [password for _, _, password in accepted], self._hash_pool
+        )
+        for (index, user, _), password_hash in zip(accepted, hashes):
+            user.password_hash = password_hash
+            results[index] = self._save_and_send_verification(user)
+        
+        return results
+
     def login_user(self, email: str, password: str) -> LoginResult:
         """Authenticate user with email and password"""
         
         if not email or not password:
             return LoginResult(success=False, message="Email and password are required")
         
-        user = self.user_repository.find_by_email(email.lower().strip())
+        email = self._normalize_email(email)
+        user = self._find_by_email_cached(email)
         if not user:
+            # Same hashing work as a real account, so timing doesn't reveal which emails exist
+            self.password_hasher.verify_password(password, self._dummy_hash)
             return LoginResult(success=False, message="Invalid credentials")
         
+        # Read the clock once for both the lock check and a possible new lock
+        now = time.time()
+        
         # Check if account is locked
-        if self._is_account_locked(user):
+        if self._is_account_locked(user, now):
             return LoginResult(success=False, message="Account is temporarily locked due to too many failed attempts")
         
         # Check if email is verified
@@ -162,14 +356,14 @@ class UserService:
         
         # Verify password
         if not self.password_hasher.verify_password(password, user.password_hash):
-            self._handle_failed_login(user)
+            self._handle_failed_login(user, now)
             return LoginResult(success=False, message="Invalid credentials")
         
         # Reset failed attempts on successful login
         if user.failed_login_attempts > 0:
             user.failed_login_attempts = 0
             user.locked_until = None
-            self.user_repository.update_user(user)
+            self._update_user(user)
         
         return LoginResult(success=True, user=user, message="Login successful")
 
@@ -190,7 +384,7 @@ class UserService:
             return VerificationResult(success=True, message="Email is already verified")
         
         user.email_verified = True
-        self.user_repository.update_user(user)
+        self._update_user(user)
         
         return VerificationResult(success=True, message="Email verified successfully")
 
@@ -215,13 +409,99 @@ class UserService:
         
         # Update password
         user.password_hash = self.password_hasher.hash_password(new_password)
-        self.user_repository.update_user(user)
+        self._update_user(user)
         
         return True
 
+    def track_known_emails(self, emails: Iterable[str], capacity: int = 100_000) -> None:
+        """Seed the email filter with every stored address so lookups for new emails skip the repository"""
+        # Only safe while this service is the sole writer: users saved elsewhere never reach the filter
+        known_emails = BloomFilter(capacity)
+        for email in emails:
+            known_emails.add(self._normalize_email(email))
+        self._known_emails = known_emails
+
     # Private helper methods - easy to test individually
 
-    def _validate_registration_input(self, email: str, password: str, first_name: str, last_name: str) -> Optional[str]:
+    def _find_by_email_cached(self, email: str) -> Optional[User]:
+        """Repository lookup by normalized email, served from the short-lived cache when possible"""
+        user = self._user_cache.get(email)
+        if user is None and self._may_exist(email):
+            user = self.user_repository.find_by_email(email)
+            if user is not None:
+                self._user_cache.put(email, user)
+        return user
+
+    def _update_user(self, user: User) -> None:
+        """Persist changes and drop the cached copy so the next lookup sees them"""
+        self.user_repository.update_user(user)
+        self._user_cache.pop(user.email)
+
+    def _may_exist(self, email: str) -> bool:
+        """False only when the filter proves the normalized email was never stored"""
+        return self._known_emails is None or email in self._known_emails
+
+    def _new_user(self, email: str, password: str, first_name: str, last_name: str,
+                  now: datetime, password_classes: Optional[int] = None) -> Tuple[Optional[User], Optional[str]]:
+        """Build an unsaved user from valid input, or return why registration can't proceed"""
+        
+        # Validate inputs
+        validation_error = self._validate_registration_input(
+            email, password, first_name, last_name, password_classes
+        )
+        if validation_error:
+            return None, validation_error
+        
+        # Normalize once; lookup, storage and the verification email all use it
+        email = self._normalize_email(email)
+        
+        # Check if user already exists
+        existing_user = self._may_exist(email) and self.user_repository.find_by_email(email)
+        if existing_user:
+            return None, "User already exists with this email"
+        
+        # Create user
+        user = User(
+            id=None,  # Will be set by repository
+            email=email,
+            first_name=first_name.strip(),
+            last_name=last_name.strip(),
+            created_at=now
+        )
+        return user, None
+
+    def _save_and_send_verification(self, user: User) -> RegistrationResult:
+        """Persist a hashed user and send the verification email"""
+        
+        # Save user
+        user_id = self.user_repository.save_user(user)
+        if self._known_emails is not None:
+            self._known_emails.add(user.email)
+        
+        # Generate and send verification email
+        verification_token = self.token_generator.generate_token()
+        email_sent = self.email_service.send_verification_email(user.email, verification_token)
+        
+        if not email_sent:
+            return RegistrationResult(
+                success=False, 
+                message="User created but verification email failed"
+            )
+        
+        return RegistrationResult(
+            success=True,
+            user_id=user_id,
+            verification_token=verification_token,
+            message="User registered successfully. Please check your email for verification."
+        )
+
+    @staticmethod
+    def _normalize_email(email: str) -> str:
+        """Canonical form used for every lookup and stored address"""
+        return email.strip().lower()
+
+    def _validate_registration_input(self, email: str, password: str, first_name: str, last_name: str,
+                                     password_classes: Optional[int] = None) -> Optional[str]:
         """Validate user registration input"""
         
         if not email or not email.strip():
@@ -230,7 +510,7 @@ class UserService:
         if not self._is_valid_email(email):
             return "Invalid email format"
         
-        password_error = self._validate_password(password)
+        password_error = self._validate_password(password, password_classes)
         if password_error:
             return password_error
         
@@ -242,8 +522,8 @@ class UserService:
         
         return None
 
-    def _validate_password(self, password: str) -> Optional[str]:
-        """Validate password requirements"""
+    def _validate_password(self, password: str, classes: Optional[int] = None) -> Optional[str]:
+        """Validate password requirements; bulk callers pass classes already scanned for the batch"""
         
         if not password:
             return "Password is required"
@@ -251,36 +531,44 @@ class UserService:
         if len(password) < self.min_password_length:
             return f"Password must be at least {self.min_password_length} characters long"
         
-        if not re.search(r'[A-Z]', password):
+        if classes is None:
+            classes = _scan_password_classes(password)
+        
+        if not classes & _HAS_UPPER:
             return "Password must contain at least one uppercase letter"
         
-        if not re.search(r'[a-z]', password):
+        if not classes & _HAS_LOWER:
             return "Password must contain at least one lowercase letter"
         
-        if not re.search(r'\d', password):
+        if not classes & _HAS_DIGIT:
             return "Password must contain at least one number"
         
         return None
 
     def _is_valid_email(self, email: str) -> bool:
-        """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        """Validate email format: local@domain.tld, with a TLD of two or more letters"""
+        at = email.find('@')
+        dot = email.rfind('.')
+        # Non-empty local part, at least one domain character before the last dot
+        if at <= 0 or dot - at < 2 or len(email) - dot < 3:
+            return False
+        # A second '@' lands in the domain segment and fails its table
+        return not (email[:at].translate(_EMAIL_LOCAL_CHARS)
+                    or email[at + 1:dot].translate(_EMAIL_DOMAIN_CHARS)
+                    or email[dot + 1:].translate(_EMAIL_TLD_CHARS))
 
-    def _is_account_locked(self, user: User) -> bool:
+    def _is_account_locked(self, user: User, now: float) -> bool:
         """Check if user account is locked"""
-        if not user.locked_until:
-            return False
-        return datetime.now() < user.locked_until
+        return user.locked_until is not None and now < user.locked_until
 
-    def _handle_failed_login(self, user: User) -> None:
+    def _handle_failed_login(self, user: User, now: float) -> None:
         """Handle failed login attempt"""
         user.failed_login_attempts += 1
         
         if user.failed_login_attempts >= self.max_failed_attempts:
-            user.locked_until = datetime.now() + timedelta(hours=self.lockout_duration_hours)
+            user.locked_until = now + self._lockout_seconds
         
-        self.user_repository.update_user(user)
+        self._update_user(user)
 
     def _find_user_by_verification_token(self, token: str) -> Optional[User]:
         """Find user by verification token (simplified for example)"""
@@ -291,11 +579,41 @@ class UserService:
 
 # Implementation classes
 class BCryptPasswordHasher(PasswordHasher):
-    def hash_password(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    def __init__(self, cost: int = 12):
+        self.cost = cost
+        # Bound once so each call skips the module attribute lookups;
+        # the salt itself must still be fresh per hash
+        self._hashpw = bcrypt.hashpw
+        self._checkpw = bcrypt.checkpw
+        self._gensalt = bcrypt.gensalt
+    
+    def hash_password(self, password: str) -> bytes:
+        return self._hashpw(password.encode('utf-8'), self._gensalt(rounds=self.cost))
+    
+    def verify_password(self, password: str, hashed: bytes) -> bool:
+        return self._checkpw(password.encode('utf-8'), hashed)
+
+class Argon2PasswordHasher(PasswordHasher):
+    def __init__(self, **params):
+        # One long-lived hasher: parameters are validated once, not per call
+        self._hasher = argon2.PasswordHasher(**params)
+    
+    def hash_password(self, password: str) -> bytes:
+        return self._hasher.hash(password).encode('ascii')
     
-    def verify_password(self, password: str, hashed: str) -> bool:
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    def verify_password(self, password: str, hashed: bytes) -> bool:
+        try:
+            return self._hasher.verify(hashed, password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+def create_password_hasher(cost: int = 12) -> PasswordHasher:
+    """Prefer bcrypt at the given cost, falling back to Argon2 when bcrypt isn't installed"""
+    if bcrypt is not None:
+        return BCryptPasswordHasher(cost)
+    if argon2 is not None:
+        return Argon2PasswordHasher()
+    raise RuntimeError("Install bcrypt or argon2-cffi to hash passwords")
 
 class SecureTokenGenerator(TokenGenerator):
     def generate_token(self) -> str:
@@ -305,17 +623,80 @@ class SecureTokenGenerator(TokenGenerator):
 # ===== COMPREHENSIVE TEST SUITE =====
 
 import unittest
-from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime
+
+
+# Fixture templates built once at import; tests take their own copy with replace()
+_FIXED_DT = datetime(2024, 1, 1)
+_VERIFIED_USER = User("123", "john@example.com", "John", "Doe", _FIXED_DT,
+                      email_verified=True, password_hash=b"hashed:Password123")
+
+
+# Hand-rolled fakes - plain objects that record what the service did with them
+class FakeUserRepository(UserRepository):
+    def __init__(self):
+        self.users: Dict[str, User] = {}
+        self.saved: List[User] = []
+        self.updated: List[User] = []
+    
+    def add(self, user: User) -> None:
+        self.users[user.id] = user
+    
+    def save_user(self, user: User) -> str:
+        self.saved.append(user)
+        user.id = f"user{len(self.saved)}"
+        self.users[user.id] = user
+        return user.id
+    
+    def find_by_email(self, email: str) -> Optional[User]:
+        return next((user for user in self.users.values() if user.email == email), None)
+    
+    def find_by_id(self, user_id: str) -> Optional[User]:
+        return self.users.get(user_id)
+    
+    def update_user(self, user: User) -> None:
+        self.updated.append(user)
+
+class FakeEmailService(EmailService):
+    def __init__(self):
+        self.succeed = True
+        self.sent: List[Tuple[str, str]] = []
+    
+    def send_verification_email(self, email: str, token: str) -> bool:
+        self.sent.append((email, token))
+        return self.succeed
+
+class FakeTokenGenerator(TokenGenerator):
+    def generate_token(self) -> str:
+        return "verification_token"
+
+class FakePasswordHasher(PasswordHasher):
+    def __init__(self):
+        self.batches: List[List[str]] = []
+        self.executors: List[Executor] = []
+        self.verified: List[bytes] = []
+    
+    def hash_password(self, password: str) -> bytes:
+        return f"hashed:{password}".encode('utf-8')
+    
+    def verify_password(self, password: str, hashed: bytes) -> bool:
+        self.verified.append(hashed)
+        return hashed == self.hash_password(password)
+    
+    def hash_passwords_batch(self, passwords: List[str], executor: Executor) -> List[bytes]:
+        self.batches.append(list(passwords))
+        self.executors.append(executor)
+        return [self.hash_password(password) for password in passwords]
 
 
 class TestUserService(unittest.TestCase):
     
     def setUp(self):
-        self.user_repository = Mock(spec=UserRepository)
-        self.email_service = Mock(spec=EmailService)
-        self.token_generator = Mock(spec=TokenGenerator)
-        self.password_hasher = Mock(spec=PasswordHasher)
+        self.user_repository = FakeUserRepository()
+        self.email_service = FakeEmailService()
+        self.token_generator = FakeTokenGenerator()
+        self.password_hasher = FakePasswordHasher()
         
         self.user_service = UserService(
             self.user_repository,
@@ -323,15 +704,9 @@ class TestUserService(unittest.TestCase):
             self.token_generator,
             self.password_hasher
         )
+        self.addCleanup(self.user_service.close)
 
     def test_register_user_success(self):
-        # Arrange
-        self.user_repository.find_by_email.return_value = None
-        self.user_repository.save_user.return_value = "user123"
-        self.password_hasher.hash_password.return_value = "hashed_password"
-        self.token_generator.generate_token.return_value = "verification_token"
-        self.email_service.send_verification_email.return_value = True
-        
         # Act
         result = self.user_service.register_user(
             "john@example.com", "Password123", "John", "Doe"
@@ -339,17 +714,25 @@ class TestUserService(unittest.TestCase):
         
         # Assert
         self.assertTrue(result.success)
-        self.assertEqual(result.user_id, "user123")
+        self.assertEqual(result.user_id, "user1")
         self.assertEqual(result.verification_token, "verification_token")
-        self.user_repository.save_user.assert_called_once()
-        self.email_service.send_verification_email.assert_called_once_with(
-            "john@example.com", "verification_token"
-        )
+        self.assertEqual(len(self.user_repository.saved), 1)
+        self.assertEqual(self.user_repository.saved[0].password_hash, b"hashed:Password123")
+        self.assertEqual(self.email_service.sent, [("john@example.com", "verification_token")])
+
+    def test_register_user_async_success(self):
+        # Act
+        result = asyncio.run(self.user_service.register_user_async(
+            "john@example.com", "Password123", "John", "Doe"
+        ))
+        
+        # Assert
+        self.assertTrue(result.success)
+        self.assertEqual(self.user_repository.saved[0].password_hash, b"hashed:Password123")
 
     def test_register_user_duplicate_email(self):
         # Arrange
-        existing_user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        self.user_repository.find_by_email.return_value = existing_user
+        self.user_repository.add(replace(_VERIFIED_USER))
         
         # Act
         result = self.user_service.register_user(
@@ -359,7 +742,7 @@ class TestUserService(unittest.TestCase):
         # Assert
         self.assertFalse(result.success)
         self.assertEqual(result.message, "User already exists with this email")
-        self.user_repository.save_user.assert_not_called()
+        self.assertEqual(self.user_repository.saved, [])
 
     def test_register_user_invalid_email(self):
         # Act
@@ -383,11 +766,7 @@ class TestUserService(unittest.TestCase):
 
     def test_register_user_email_send_failure(self):
         # Arrange
-        self.user_repository.find_by_email.return_value = None
-        self.user_repository.save_user.return_value = "user123"
-        self.password_hasher.hash_password.return_value = "hashed_password"
-        self.token_generator.generate_token.return_value = "verification_token"
-        self.email_service.send_verification_email.return_value = False
+        self.email_service.succeed = False
         
         # Act
         result = self.user_service.register_user(
@@ -398,14 +777,45 @@ class TestUserService(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("verification email failed", result.message)
 
+    def test_register_users_bulk_hashes_valid_entries_in_one_batch(self):
+        # Act
+        results = self.user_service.register_users_bulk([
+            ("john@example.com", "Password123", "John", "Doe"),
+            ("invalid-email", "Password123", "Jane", "Doe"),
+            ("jane@example.com", "Password456", "Jane", "Doe"),
+        ])
+        
+        # Assert
+        self.assertEqual([result.success for result in results], [True, False, True])
+        self.assertEqual(results[2].user_id, "user2")
+        self.assertEqual(self.password_hasher.batches, [["Password123", "Password456"]])
+        self.assertEqual(self.password_hasher.executors, [self.user_service._hash_pool])
+
+    def test_exiting_the_service_shuts_down_the_hash_pool(self):
+        # Act
+        with self.user_service as service:
+            pass
+        
+        # Assert
+        with self.assertRaises(RuntimeError):
+            service._hash_pool.submit(print)
+
+    def test_email_filter_skips_repository_for_unknown_emails(self):
+        # Arrange - a user the filter was never told about
+        self.user_repository.add(replace(_VERIFIED_USER))
+        self.user_service.track_known_emails([])
+        
+        # Act
+        login_result = self.user_service.login_user("john@example.com", "Password123")
+        self.user_service.register_user("jane@example.com", "Password123", "Jane", "Doe")
+        
+        # Assert
+        self.assertEqual(login_result.message, "Invalid credentials")
+        self.assertIn("jane@example.com", self.user_service._known_emails)
+
     def test_login_user_success(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.email_verified = True
-        user.password_hash = "hashed_password"
-        
-        self.user_repository.find_by_email.return_value = user
-        self.password_hasher.verify_password.return_value = True
+        self.user_repository.add(replace(_VERIFIED_USER))
         
         # Act
         result = self.user_service.login_user("john@example.com", "Password123")
@@ -415,24 +825,58 @@ class TestUserService(unittest.TestCase):
         self.assertEqual(result.user.email, "john@example.com")
         self.assertEqual(result.message, "Login successful")
 
-    def test_login_user_invalid_credentials(self):
+    def test_login_user_reuses_recently_loaded_user(self):
+        # Arrange
+        self.user_repository.add(replace(_VERIFIED_USER))
+        self.user_service.login_user("john@example.com", "Password123")
+        self.user_repository.users.clear()
+        
+        # Act
+        result = self.user_service.login_user("john@example.com", "Password123")
+        
+        # Assert
+        self.assertTrue(result.success)
+
+    def test_login_user_failure_drops_cached_user(self):
         # Arrange
-        self.user_repository.find_by_email.return_value = None
+        self.user_repository.add(replace(_VERIFIED_USER))
+        self.user_service.login_user("john@example.com", "Password123")
+        self.user_service.login_user("john@example.com", "WrongPassword")
+        self.user_repository.users.clear()
         
         # Act
         result = self.user_service.login_user("john@example.com", "Password123")
         
         # Assert
         self.assertFalse(result.success)
+
+    def test_change_password_drops_cached_user(self):
+        # Arrange
+        self.user_repository.add(replace(_VERIFIED_USER))
+        self.user_service.login_user("john@example.com", "Password123")
+        self.user_service.change_password("123", "Password123", "NewPassword123")
+        self.user_repository.users.clear()
+        
+        # Act
+        result = self.user_service.login_user("john@example.com", "NewPassword123")
+        
+        # Assert
+        self.assertFalse(result.success)
+
+    def test_login_user_invalid_credentials(self):
+        # Act
+        result = self.user_service.login_user("john@example.com", "Password123")
+        
+        # Assert
+        self.assertFalse(result.success)
         self.assertEqual(result.message, "Invalid credentials")
+        self.assertEqual(self.password_hasher.verified, [b"hashed:xxxxxxxxxxxxxxxx"])
 
     def test_login_user_unverified_email(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.email_verified = False
-        user.password_hash = "hashed_password"
+        user = replace(_VERIFIED_USER, email_verified=False)
         
-        self.user_repository.find_by_email.return_value = user
+        self.user_repository.add(user)
         
         # Act
         result = self.user_service.login_user("john@example.com", "Password123")
@@ -443,11 +887,9 @@ class TestUserService(unittest.TestCase):
 
     def test_login_user_account_locked(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.email_verified = True
-        user.locked_until = datetime.now() + timedelta(hours=1)
+        user = replace(_VERIFIED_USER, locked_until=time.time() + 3600)
         
-        self.user_repository.find_by_email.return_value = user
+        self.user_repository.add(user)
         
         # Act
         result = self.user_service.login_user("john@example.com", "Password123")
@@ -458,13 +900,9 @@ class TestUserService(unittest.TestCase):
 
     def test_login_user_wrong_password_increments_failed_attempts(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.email_verified = True
-        user.password_hash = "hashed_password"
-        user.failed_login_attempts = 2
+        user = replace(_VERIFIED_USER, failed_login_attempts=2)
         
-        self.user_repository.find_by_email.return_value = user
-        self.password_hasher.verify_password.return_value = False
+        self.user_repository.add(user)
         
         # Act
         result = self.user_service.login_user("john@example.com", "WrongPassword")
@@ -472,17 +910,13 @@ class TestUserService(unittest.TestCase):
         # Assert
         self.assertFalse(result.success)
         self.assertEqual(user.failed_login_attempts, 3)
-        self.user_repository.update_user.assert_called_once_with(user)
+        self.assertEqual(self.user_repository.updated, [user])
 
     def test_login_user_locks_account_after_max_failures(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.email_verified = True
-        user.password_hash = "hashed_password"
-        user.failed_login_attempts = 4  # One less than max
+        user = replace(_VERIFIED_USER, failed_login_attempts=4)  # One less than max
         
-        self.user_repository.find_by_email.return_value = user
-        self.password_hasher.verify_password.return_value = False
+        self.user_repository.add(user)
         
         # Act
         result = self.user_service.login_user("john@example.com", "WrongPassword")
@@ -491,32 +925,40 @@ class TestUserService(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertEqual(user.failed_login_attempts, 5)
         self.assertIsNotNone(user.locked_until)
-        self.user_repository.update_user.assert_called_once_with(user)
+        self.assertEqual(self.user_repository.updated, [user])
+
+    def test_login_user_lockout_follows_configured_duration(self):
+        # Arrange
+        user = replace(_VERIFIED_USER, failed_login_attempts=4)
+        self.user_repository.add(user)
+        self.user_service.lockout_duration_hours = 1
+        
+        # Act
+        before = time.time()
+        self.user_service.login_user("john@example.com", "WrongPassword")
+        
+        # Assert
+        self.assertAlmostEqual(user.locked_until - before, 3600, delta=5)
 
     def test_change_password_success(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.password_hash = "old_hashed_password"
+        user = replace(_VERIFIED_USER, password_hash=b"hashed:OldPassword123")
         
-        self.user_repository.find_by_id.return_value = user
-        self.password_hasher.verify_password.return_value = True
-        self.password_hasher.hash_password.return_value = "new_hashed_password"
+        self.user_repository.add(user)
         
         # Act
         result = self.user_service.change_password("123", "OldPassword123", "NewPassword123")
         
         # Assert
         self.assertTrue(result)
-        self.password_hasher.hash_password.assert_called_with("NewPassword123")
-        self.user_repository.update_user.assert_called_once_with(user)
+        self.assertEqual(user.password_hash, b"hashed:NewPassword123")
+        self.assertEqual(self.user_repository.updated, [user])
 
     def test_change_password_wrong_old_password(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.password_hash = "old_hashed_password"
+        user = replace(_VERIFIED_USER, password_hash=b"hashed:OldPassword123")
         
-        self.user_repository.find_by_id.return_value = user
-        self.password_hasher.verify_password.return_value = False
+        self.user_repository.add(user)
         
         # Act & Assert
         with self.assertRaises(ValueError) as context:
@@ -526,11 +968,9 @@ class TestUserService(unittest.TestCase):
 
     def test_change_password_invalid_new_password(self):
         # Arrange
-        user = User("123", "john@example.com", "John", "Doe", datetime.now())
-        user.password_hash = "old_hashed_password"
+        user = replace(_VERIFIED_USER, password_hash=b"hashed:OldPassword123")
         
-        self.user_repository.find_by_id.return_value = user
-        self.password_hasher.verify_password.return_value = True
+        self.user_repository.add(user)
         
         # Act & Assert
         with self.assertRaises(ValueError) as context:
@@ -542,7 +982,10 @@ class TestUserService(unittest.TestCase):
 class TestPasswordValidation(unittest.TestCase):
     
     def setUp(self):
-        self.user_service = UserService(Mock(), Mock(), Mock(), Mock())
+        self.user_service = UserService(
+            FakeUserRepository(), FakeEmailService(), FakeTokenGenerator(), FakePasswordHasher()
+        )
+        self.addCleanup(self.user_service.close)
     
     def test_validate_password_success(self):
         result = self.user_service._validate_password("StrongPass123")
@@ -563,12 +1006,20 @@ class TestPasswordValidation(unittest.TestCase):
     def test_validate_password_no_number(self):
         result = self.user_service._validate_password("NoNumbers")
         self.assertIn("number", result)
+    
+    def test_batch_scan_matches_single_password_scan(self):
+        passwords = ["Password123", "lowercase123", "ÜPPERcase١٢", "", None]
+        expected = [_scan_password_classes(password) if password else 0 for password in passwords]
+        self.assertEqual(_scan_password_classes_batch(passwords), expected)
 
 
 class TestEmailValidation(unittest.TestCase):
     
     def setUp(self):
-        self.user_service = UserService(Mock(), Mock(), Mock(), Mock())
+        self.user_service = UserService(
+            FakeUserRepository(), FakeEmailService(), FakeTokenGenerator(), FakePasswordHasher()
+        )
+        self.addCleanup(self.user_service.close)
     
     def test_valid_emails(self):
         valid_emails = [
@@ -595,6 +1046,28 @@ class TestEmailValidation(unittest.TestCase):
                 self.assertFalse(self.user_service._is_valid_email(email))
 
 
+class TestExpiringLRUCache(unittest.TestCase):
+    
+    def test_get_returns_stored_value(self):
+        cache = ExpiringLRUCache(maxsize=2, ttl=60)
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+    
+    def test_entries_expire_after_ttl(self):
+        cache = ExpiringLRUCache(maxsize=2, ttl=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ExpiringLRUCache(maxsize=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
 